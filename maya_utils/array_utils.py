@@ -0,0 +1,211 @@
+"""
+Bulk array operations, point array comparisons, centroids, matrix mirroring and name searches.
+numpy and numba are optional, the functions fall back to plain python when they are not available.
+"""
+# define private variables
+__numpy__ = None
+__jit_cache__ = {}
+
+# python 3 compatibility
+try:
+    text_type = unicode
+    xrange = xrange
+except NameError:
+    text_type = str
+    xrange = range
+
+
+def _points_close(array_1, array_2, tolerance):
+    """
+    compares the flat coordinate arrays item by item.
+    :param array_1: <numpy.ndarray>, <list> first array of coordinates.
+    :param array_2: <numpy.ndarray>, <list> second array of coordinates.
+    :param tolerance: <float> the maximum difference allowed between the coordinates.
+    :return: <bool> True for match. <bool> False for no match.
+    """
+    for i in range(len(array_1)):
+        if abs(array_1[i] - array_2[i]) > tolerance:
+            return False
+    return True
+
+
+def _mesh_centroid(points):
+    """
+    sums the point rows and divides by the number of points.
+    :param points: <numpy.ndarray> (N, 3) array of coordinates.
+    :return: <tuple> x, y, z centroid.
+    """
+    s0 = s1 = s2 = 0.0
+    n = points.shape[0]
+    for i in range(n):
+        s0 += points[i, 0]
+        s1 += points[i, 1]
+        s2 += points[i, 2]
+    return s0 / n, s1 / n, s2 / n
+
+
+def _get_numpy():
+    """
+    imports numpy on first use, a missing numpy is remembered so the import is only tried once.
+    :return: <module> numpy. <NoneType> when numpy is not available.
+    """
+    global __numpy__
+    if __numpy__ is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        __numpy__ = numpy
+    return __numpy__ or None
+
+
+def _get_jit(func, signature):
+    """
+    compiles the function with numba on the first call that needs it, so importing this module stays cheap.
+    :param func: <function> the python function to compile.
+    :param signature: <str> the numba signature to compile the function with.
+    :return: <function> the compiled function. <NoneType> when numpy or numba are not available.
+    """
+    if func in __jit_cache__:
+        return __jit_cache__[func]
+    jit_func = None
+    if _get_numpy() is not None:
+        try:
+            from numba import njit
+        except ImportError:
+            njit = None
+        if njit is not None:
+            jit_func = njit(signature, cache=True, fastmath=True)(func)
+    __jit_cache__[func] = jit_func
+    return jit_func
+
+
+def get_point_coordinates(points):
+    """
+    flattens the point array into a list of coordinates.
+    :param points: <OpenMaya.MPointArray>, <tuple> array of points or coordinate arrays.
+    :return: <list> x, y, z coordinates.
+    """
+    if hasattr(points, 'length'):
+        points = [points[i] for i in xrange(points.length())]
+    coordinates = []
+    for point in points:
+        if hasattr(point, 'x'):
+            coordinates.extend((point.x, point.y, point.z))
+        else:
+            coordinates.extend(point)
+    return coordinates
+
+
+def get_point_rows(points):
+    """
+    converts the point array into x, y, z rows.
+    :param points: <OpenMaya.MPointArray>, <tuple> array of points or coordinate arrays.
+    :return: <numpy.ndarray> (N, 3) array, <list> of coordinate tuples when numpy is not available.
+    """
+    numpy = _get_numpy()
+    coordinates = get_point_coordinates(points)
+    if numpy is None:
+        return [tuple(coordinates[i:i + 3]) for i in xrange(0, len(coordinates), 3)]
+    return numpy.asarray(coordinates, dtype=numpy.float64).reshape(-1, 3)
+
+
+def compare_point_arrays(array_1, array_2, tolerance=0.0):
+    """
+    compare the points from array_1, to array_2 within the tolerance given.
+    :param array_1: <OpenMaya.MPointArray>, <tuple> array of points.
+    :param array_2: <OpenMaya.MPointArray>, <tuple> array of points.
+    :param tolerance: <float> the maximum difference allowed between the coordinates.
+    :return: <bool> True for yes. <bool> False for no.
+    """
+    numpy = _get_numpy()
+    array_1 = get_point_coordinates(array_1)
+    array_2 = get_point_coordinates(array_2)
+    if len(array_1) != len(array_2):
+        return False
+    if numpy is None:
+        return _points_close(array_1, array_2, tolerance)
+    array_1 = numpy.asarray(array_1, dtype=numpy.float64)
+    array_2 = numpy.asarray(array_2, dtype=numpy.float64)
+    points_close_jit = _get_jit(_points_close, 'b1(f8[:], f8[:], f8)')
+    if points_close_jit is not None:
+        return bool(points_close_jit(array_1, array_2, float(tolerance)))
+    if not tolerance:
+        return bool(numpy.array_equal(array_1, array_2))
+    return bool(numpy.allclose(array_1, array_2, rtol=0.0, atol=tolerance))
+
+
+def get_point_centroid(points):
+    """
+    get the average position of the points.
+    :param points: <numpy.ndarray>, <OpenMaya.MPointArray>, <tuple> array of points or coordinate rows.
+    :return: <tuple> x, y, z centroid.
+    """
+    numpy = _get_numpy()
+    if numpy is None:
+        rows = get_point_rows(points)
+        if not rows:
+            return ()
+        n = float(len(rows))
+        return tuple([sum(axis) / n for axis in zip(*rows)])
+    if not isinstance(points, numpy.ndarray):
+        points = get_point_rows(points)
+    if not len(points):
+        return ()
+    points = numpy.ascontiguousarray(points, dtype=numpy.float64)
+    mesh_centroid_jit = _get_jit(_mesh_centroid, 'UniTuple(f8, 3)(f8[:, :])')
+    if mesh_centroid_jit is not None:
+        return tuple(mesh_centroid_jit(points))
+    return tuple(points.mean(axis=0).tolist())
+
+
+def mirror_matrices(matrices, across='YZ', behaviour=False):
+    """
+    mirrors the flat 16 value matrices across the plane given, the same as transform_utils.Transform.mirror_matrix.
+    :param matrices: <list>, <numpy.ndarray> array of matrix lists, or one matrix list.
+    :param across: <str> the planar axis to mirror across.
+    :param behaviour: <bool> mirrors the behaviour of the transform object.
+    :return: <list> array of mirrored matrix lists.
+    """
+    numpy = _get_numpy()
+    # the translation index to invert, and the rotation columns to invert for behaviour
+    if across == 'XY':
+        t_index, columns = 14, (0, 1)
+    elif across == 'YZ':
+        t_index, columns = 12, (1, 2)
+    else:
+        t_index, columns = 13, (0, 2)
+
+    if numpy is None:
+        if matrices and not hasattr(matrices[0], '__iter__'):
+            matrices = [matrices]
+        mirrored = []
+        for matrix in matrices:
+            matrix = list(matrix)
+            matrix[t_index] *= -1
+            if behaviour:
+                for column in columns:
+                    matrix[column:column + 9:4] = [n * -1 for n in matrix[column:column + 9:4]]
+            mirrored.append(matrix)
+        return mirrored
+
+    matrices = numpy.array(matrices, dtype=numpy.float64).reshape(-1, 16)
+    matrices[:, t_index] *= -1
+    if behaviour:
+        for column in columns:
+            matrices[:, column:column + 9:4] *= -1
+    return matrices.tolist()
+
+
+def find_names(names=(), search=""):
+    """
+    find the indices of the names containing the search string.
+    :param names: <tuple>, <list> array of names to search.
+    :param search: <str> the string to find in the names.
+    :return: <list> indices of the matching names.
+    """
+    numpy = _get_numpy()
+    if numpy is None or not names:
+        return [i for i, name in enumerate(names) if search in name]
+    mask = numpy.char.find(numpy.array(names, dtype=text_type), text_type(search)) >= 0
+    return numpy.flatnonzero(mask).tolist()
@@ -4,6 +4,7 @@ module for getting data from NurbsCurve.
 # import maya modules
 from maya import OpenMaya
 from maya import cmds
+from maya import mel
 
 # import local modules
 import object_utils
@@ -17,6 +18,12 @@ create_node = object_utils.create_node
 attr_name = object_utils.attr_name
 attr_set = object_utils.attr_set
 
+nurb_colors = {
+    'yellow': (1.0, 1.0, 0.0),
+    'blue': (0.0, 0.0, 1.0),
+    'red': (1.0, 0.0, 0.0),
+}
+
 world_transform = lambda x: transform_utils.Transform(x).get_world_translation_list()
 
 
@@ -228,18 +235,37 @@ def set_nurb_shape_color(shape_name="", color='yellow'):
     cmds.setAttr(shape_name + '.overrideEnabled', 1)
     cmds.setAttr(shape_name + '.overrideRGBColors', 1)
     if isinstance(color, (str, unicode)):
-        if color == 'yellow':
-            cmds.setAttr(shape_name + '.overrideColorRGB', 1.0, 1.0, 0.0, type='double3')
-        if color == 'blue':
-            cmds.setAttr(shape_name + '.overrideColorRGB', 0.0, 0.0, 1.0, type='double3')
-        if color == 'red':
-            cmds.setAttr(shape_name + '.overrideColorRGB', 1.0, 0.0, 0.0, type='double3')
+        if color in nurb_colors:
+            cmds.setAttr(shape_name + '.overrideColorRGB', *nurb_colors[color], type='double3')
     elif isinstance(color, (list, tuple)):
         r, g, b = color
         cmds.setAttr(shape_name + '.overrideColorRGB', r, g, b, type='double3')
     return True
 
 
+def set_nurb_shapes_color(shape_names=(), color='yellow'):
+    """
+    sets the same color on all the nurbsCurve shapes given, in one call.
+    :param shape_names: <tuple> array of shape names to change settings on.
+    :param color: <str>, <list>, <list> color property.
+    :return: <bool> True for success. <bool> False for failure.
+    """
+    if isinstance(color, object_utils.string_types):
+        if color not in nurb_colors:
+            return False
+        color = nurb_colors[color]
+    if not shape_names:
+        return False
+    r, g, b = color
+    set_commands = []
+    for shape_name in shape_names:
+        set_commands.append('setAttr "{}.overrideEnabled" 1'.format(shape_name))
+        set_commands.append('setAttr "{}.overrideRGBColors" 1'.format(shape_name))
+        set_commands.append('setAttr "{}.overrideColorRGB" -type double3 {} {} {}'.format(shape_name, r, g, b))
+    mel.eval(';'.join(set_commands) + ';')
+    return True
+
+
 def curve_info_matrix(point_on_curve=""):
     """
     get the matrix from point on curve info node.
@@ -1,40 +1,28 @@
 """
 Manipulating and traversing the Maya scene objects and connections.
-Lesson in data science:
-    # everything up to but not including index 3
-    print(z[:3])
-
-    # index 1 to end of list
-    print(z[1:])
-
-line = re.sub(r'''
-  (?x) # Use free-spacing mode.
-  <    # Match a literal '<'
-  /?   # Optionally match a '/'
-  \[   # Match a literal '['
-  \d+  # Match one or more digits
-  >    # Match a literal '>'
-  .    # Match any single character except '\n'
-  ^    # Match if string starts with a character
-  $    # Match of string ends with a character
-  *    # Match a pattern of zero or more occurrences
-  +    # Match one or more occurrences of a pattern at the left
-  ?    # Match zero or one occurrence of the patter at the left
-  |    # Alternation "or" operator
-  ()   # Grouping sub-patterns, match any strings inside parentheses
-  ''', '', line)
 """
 # import standard modules
 import re
+import contextlib
 import collections
 
 # import maya modules
 from maya import cmds
 from maya import OpenMaya as OpenMaya
 from maya import OpenMayaAnim as OpenMayaAnim
+from maya.api import OpenMaya as OpenMaya2
 
 # import local modules
 import attribute_utils
+import array_utils
+
+# python 3 compatibility
+try:
+    string_types = (str, unicode)
+    xrange = xrange
+except NameError:
+    string_types = (str,)
+    xrange = range
 
 # define local variables
 node_types = {
@@ -68,9 +56,165 @@ node_types = {
     'wrap':                 OpenMaya.MFn.kWrapFilter,
     'shrinkWrap':           OpenMaya.MFn.kShrinkWrapFilter,
     }
+_NODE_GET = node_types.get
+_NODE_TYPE_SET = frozenset(node_types)
+_NODE_FN_VALUES = frozenset(node_types.values())
+_K_TRANSFORM = node_types['transform']
+_K_DAG = node_types['dag']
+_K_ANIM_CURVE = node_types['animCurve']
+_K_OBJECTS = tuple(k for k in dir(OpenMaya.MFn) if k.startswith('k'))
+_K_SPACE = {
+    'world':                OpenMaya.MSpace.kWorld,
+    'object':               OpenMaya.MSpace.kObject,
+    'transform':            OpenMaya.MSpace.kTransform,
+    }
+_K_SPACE2 = {
+    'world':                OpenMaya2.MSpace.kWorld,
+    'object':               OpenMaya2.MSpace.kObject,
+    'transform':            OpenMaya2.MSpace.kTransform,
+    }
+_STR_TYPES = string_types + (bytes,)
+_FN_TABLE = {
+    OpenMaya.MFn.kMesh:             OpenMaya.MFnMesh,
+    OpenMaya.MFn.kNurbsCurve:       OpenMaya.MFnNurbsCurve,
+    OpenMaya.MFn.kNurbsSurface:     OpenMaya.MFnNurbsSurface,
+    OpenMaya.MFn.kCamera:           OpenMaya.MFnCamera,
+    OpenMaya.MFn.kJoint:            OpenMayaAnim.MFnIkJoint,
+    OpenMaya.MFn.kIkHandle:         OpenMayaAnim.MFnIkHandle,
+    }
 
 # define private variables
 __verbosity__ = 0
+__m_obj_cache__ = collections.OrderedDict()
+__type_str_cache__ = collections.OrderedDict()
+__type_int_cache__ = collections.OrderedDict()
+__selection_cache__ = collections.OrderedDict()
+__name_cache__ = collections.OrderedDict()
+__scene_objects_cache__ = collections.OrderedDict()
+__shape_children_cache__ = collections.OrderedDict()
+__connections_cache__ = collections.OrderedDict()
+__plugs_cache__ = collections.OrderedDict()
+__dag_caches__ = [__m_obj_cache__, __selection_cache__, __shape_children_cache__, __connections_cache__]
+__node_added_caches__ = [__m_obj_cache__, __scene_objects_cache__]
+__connection_caches__ = [__connections_cache__, __plugs_cache__]
+__caches__ = [__m_obj_cache__, __type_str_cache__, __type_int_cache__, __selection_cache__, __name_cache__,
+              __scene_objects_cache__, __shape_children_cache__, __connections_cache__, __plugs_cache__]
+__cache_max_size__ = 32768
+__object_types_cache__ = {}
+__regex_cache__ = collections.OrderedDict()
+__selection_tracked__ = False
+__suspend_depth__ = 0
+
+# remove the callbacks from the previously loaded module
+try:
+    for __callback_id__ in __callbacks__:
+        OpenMaya.MMessage.removeCallback(__callback_id__)
+except NameError:
+    pass
+__callbacks__ = []
+
+
+def clear_caches(*args):
+    """
+    flushes the stored name, type lookup results. Called by the scene callbacks.
+    :param args: callback arguments, not used.
+    :return: <None>
+    """
+    for cache in __caches__:
+        cache.clear()
+
+
+def clear_dag_caches(*args):
+    """
+    flushes the stored hierarchy lookup results. Called when the dag hierarchy changes.
+    :param args: callback arguments, not used.
+    :return: <None>
+    """
+    for cache in __dag_caches__:
+        cache.clear()
+
+
+def clear_node_added_caches(*args):
+    """
+    flushes the stored name lookups and scene object listings. Called when a node is created,
+    a new node can make a stored short name ambiguous.
+    :param args: callback arguments, not used.
+    :return: <None>
+    """
+    for cache in __node_added_caches__:
+        cache.clear()
+
+
+def clear_connection_caches(*args):
+    """
+    flushes the stored connection lookup results. Called when a connection is made or broken.
+    :param args: callback arguments, not used.
+    :return: <None>
+    """
+    for cache in __connection_caches__:
+        cache.clear()
+
+
+def add_cache_callbacks():
+    """
+    clears the lookup caches when the scene changes so stale OpenMaya.MObject(s) are not returned.
+    resets the selection order preference check on scene open.
+    :return: <None>
+    """
+    __callbacks__.append(OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeNew, clear_caches))
+    __callbacks__.append(OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterOpen, clear_caches))
+    __callbacks__.append(OpenMaya.MDGMessage.addNodeRemovedCallback(clear_caches))
+    __callbacks__.append(OpenMaya.MDGMessage.addNodeAddedCallback(clear_node_added_caches))
+    __callbacks__.append(OpenMaya.MNodeMessage.addNameChangedCallback(OpenMaya.MObject.kNullObj, clear_caches))
+    __callbacks__.append(OpenMaya.MDagMessage.addAllDagChangesCallback(clear_dag_caches))
+    __callbacks__.append(OpenMaya.MDGMessage.addConnectionCallback(clear_connection_caches))
+    __callbacks__.append(
+        OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterOpen, lambda *args: reset_selection_order()))
+
+
+def cache_value(cache, key, value):
+    """
+    store the value in the cache dictionary, the oldest values are dropped once it reaches the maximum size.
+    :param cache: <collections.OrderedDict> cache dictionary.
+    :param key: <hashable> key to store the value by.
+    :param value: <object> value to store.
+    :return: <object> value.
+    """
+    if len(cache) >= __cache_max_size__ and key not in cache:
+        cache.popitem(last=False)
+    cache[key] = value
+    return value
+
+
+def cache_handle_value(cache, key, m_handle, value):
+    """
+    store the value with the object handle it belongs to, hash codes are not unique to one object.
+    :param cache: <dict> cache dictionary.
+    :param key: <hashable> key to store the value by, made from the handle hash code.
+    :param m_handle: <OpenMaya.MObjectHandle> handle of the object the value belongs to.
+    :param value: <object> value to store.
+    :return: <object> value.
+    """
+    cache_value(cache, key, (m_handle, value))
+    return value
+
+
+def get_cached_handle_value(cache, key, m_handle):
+    """
+    get the value stored by cache_handle_value, only when it was stored for this same object.
+    :param cache: <dict> cache dictionary.
+    :param key: <hashable> key the value is stored by.
+    :param m_handle: <OpenMaya.MObjectHandle> handle of the object to get the value for.
+    :return: <object> the stored value. <NoneType> when nothing is stored for this object.
+    """
+    entry = cache.get(key)
+    if entry is not None and entry[0].isValid() and entry[0].object() == m_handle.object():
+        return entry[1]
+    return None
+
+
+# register the cache callbacks
+add_cache_callbacks()
 
 
 def vprint(*args):
@@ -89,12 +233,58 @@ def flatten(array):
     :param array: <tuple>, <list> array of objects to flatten.
     :return: <str> item.
     """
-    for el in array:
-        if isinstance(el, collections.Iterable) and not isinstance(el, basestring):
-            for sub in flatten(el):
-                yield sub
-        else:
+    stack = [iter(array)]
+    while stack:
+        try:
+            el = next(stack[-1])
+        except StopIteration:
+            stack.pop()
+            continue
+        if isinstance(el, _STR_TYPES) or not hasattr(el, '__iter__'):
             yield el
+        else:
+            stack.append(iter(el))
+
+
+@contextlib.contextmanager
+def suspend_refresh(undo_chunk=True, evaluation=False):
+    """
+    suspends the viewport refresh while building, restores it on exit.
+    the viewport is only suspended when running with the interface.
+    nested blocks are free, only the outermost block changes the settings.
+    :param undo_chunk: <bool> collect the commands run inside into one undo chunk.
+    :param evaluation: <bool> also turn the evaluation manager off. Restoring a parallel mode rebuilds the
+                              evaluation graph, so this only pays off for whole builds.
+    :return: <None>
+    """
+    global __suspend_depth__
+    if __suspend_depth__:
+        __suspend_depth__ += 1
+        try:
+            yield
+        finally:
+            __suspend_depth__ -= 1
+        return
+
+    interface = not cmds.about(batch=True)
+    eval_mode = cmds.evaluationManager(q=True, mode=True)[0] if evaluation else 'off'
+    if interface:
+        cmds.refresh(suspend=True)
+    if eval_mode != 'off':
+        cmds.evaluationManager(mode='off')
+    if undo_chunk:
+        cmds.undoInfo(openChunk=True)
+    __suspend_depth__ = 1
+    try:
+        yield
+    finally:
+        __suspend_depth__ = 0
+        if undo_chunk:
+            cmds.undoInfo(closeChunk=True)
+        if eval_mode != 'off':
+            cmds.evaluationManager(mode=eval_mode)
+        if interface:
+            cmds.refresh(suspend=False)
 
 
 def select_object(object_name):
@@ -111,19 +301,26 @@ def selection_order(func):
     :return: <functionWrapper>
     """
     def wrapper(*args, **kwargs):
-        set_pref = 0
-        select_pref = cmds.selectPref(trackSelectionOrder=1, q=1)
-        if not select_pref:
-            set_pref = 1
-            cmds.selectPref(trackSelectionOrder=1)
-        # run function
-        answer = func(*args, **kwargs)
-        if set_pref:
-            cmds.selectPref(trackSelectionOrder=select_pref)
-        return answer
+        global __selection_tracked__
+        # the preference is switched on once, instead of being toggled around each call
+        if not __selection_tracked__:
+            if not cmds.selectPref(trackSelectionOrder=1, q=1):
+                cmds.selectPref(trackSelectionOrder=1)
+            __selection_tracked__ = True
+        return func(*args, **kwargs)
     return wrapper
 
 
+def reset_selection_order(*args):
+    """
+    let the selection order decorator check the trackSelectionOrder preference again.
+    :param args: callback arguments, not used.
+    :return: <None>
+    """
+    global __selection_tracked__
+    __selection_tracked__ = False
+
+
 def compare_array_lengths(array_1, array_2):
     """
     compare the array lengths from array_1, to array_2
@@ -134,6 +331,17 @@ def compare_array_lengths(array_1, array_2):
     return len(array_1) == len(array_2)
 
 
+def compare_point_arrays(array_1, array_2, tolerance=0.0):
+    """
+    compare the point positions from array_1, to array_2
+    :param array_1: <OpenMaya.MPointArray>, <tuple> array of points.
+    :param array_2: <OpenMaya.MPointArray>, <tuple> array of points.
+    :param tolerance: <float> the maximum difference allowed between the coordinates.
+    :return: <bool> True for yes. <bool> False for no.
+    """
+    return array_utils.compare_point_arrays(array_1, array_2, tolerance=tolerance)
+
+
 def get_dag(object_name="", shape=False):
     """
     returns a dag path object.
@@ -145,11 +353,12 @@ def get_dag(object_name="", shape=False):
     if not shape:
         m_sel.add(object_name)
     elif shape:
-        shapes_len = get_shapes_len(get_m_obj(object_name))
+        shape_names = get_shape_name(object_name)
+        shapes_len = len(shape_names)
         if shapes_len > 0:
             for i in xrange(shapes_len):
-                m_sel.add(get_shape_name(object_name)[i])
-        elif not shapes_len and not has_fn(get_shape_name(object_name), 'transform'):
+                m_sel.add(shape_names[i])
+        elif not shapes_len and not has_fn(object_name, 'transform'):
             m_sel.add(object_name)
     m_dag = OpenMaya.MDagPath()
     m_sel.getDagPath(0, m_dag)
@@ -176,7 +385,8 @@ def get_m_selection(objects_array=(), as_strings=False):
     if not objects_array:
         OpenMaya.MGlobal.getActiveSelectionList(m_list)
     elif objects_array:
-        map(m_list.add, objects_array)
+        for object_name in objects_array:
+            m_list.add(object_name)
     OpenMaya.MItSelectionList(m_list)
     if as_strings:
         m_string_array = list()
@@ -191,28 +401,47 @@ def get_m_selection_iter(objects_array=()):
     :param objects_array: <tuple> or <list> array of items to add.
     :return: <OpenMaya.MItSelectionList>
     """
-    m_list = OpenMaya.MSelectionList()
     if not objects_array:
+        m_list = OpenMaya.MSelectionList()
         OpenMaya.MGlobal.getActiveSelectionList(m_list)
-    elif objects_array:
-        map(m_list.add, objects_array)
+    elif all(isinstance(object_name, string_types) for object_name in objects_array):
+        m_list = _selection_from_names(tuple(objects_array))
+    else:
+        m_list = OpenMaya.MSelectionList()
+        for object_name in objects_array:
+            m_list.add(object_name)
     return OpenMaya.MItSelectionList(m_list, OpenMaya.MFn.kInvalid)
 
 
+def _selection_from_names(names):
+    """
+    gets the selection list of the object names, stores the list for the repeated lookups.
+    :param names: <tuple> array of object names to add.
+    :return: <OpenMaya.MSelectionList>
+    """
+    m_list = __selection_cache__.get(names)
+    if m_list is not None:
+        return m_list
+    m_list = OpenMaya.MSelectionList()
+    for object_name in names:
+        m_list.add(object_name)
+    return cache_value(__selection_cache__, names, m_list)
+
+
 def iterate_items(objects_array=()):
     """
     iterate through the selected items. Retrieve the MDagPath and MComponent objects.
     :return: <tuple> array of selected items.
     """
     m_iter = get_m_selection_iter(objects_array)
-    items = ()
+    items = []
     while not m_iter.isDone():
         m_dag = OpenMaya.MDagPath()
         m_component = OpenMaya.MObject()
         m_iter.getDagPath(m_dag, m_component)
-        items += m_dag, m_component,
+        items.extend((m_dag, m_component))
         m_iter.next()
-    return items
+    return tuple(items)
 
 
 def get_shape_dag(object_name=""):
@@ -233,10 +462,7 @@ def get_shape_fn(object_name=""):
     if not object_name:
         object_name = get_selected_node()
     m_shapes = get_m_shape(get_dag(object_name))
-    shape_array = ()
-    for shape in m_shapes:
-        shape_array += get_fn(shape),
-    return shape_array
+    return tuple([get_fn(shape) for shape in m_shapes])
 
 
 def get_shape_name(object_name="", shape_type=""):
@@ -266,11 +492,26 @@ def is_exists(object_name):
     :param object_name: <str>, <OpenMaya.MObject> the object to check.
     :return: <bool> True, yes it exists. <bool> False, no it does not exist.
     """
-    try:
-        m_obj = get_m_obj(object_name)
-    except RuntimeError:
-        return False
-    return not m_obj.isNull()
+    if isinstance(object_name, string_types):
+        return cmds.objExists(object_name)
+    return not object_name.isNull()
+
+
+def exist_many(object_names=()):
+    """
+    check which of the object names exist in the scene.
+    :param object_names: <tuple>, <list> array of object names to check.
+    :return: <set> the object names that exist.
+    """
+    m_list = OpenMaya.MSelectionList()
+    found = set()
+    for object_name in object_names:
+        try:
+            m_list.add(object_name)
+        except RuntimeError:
+            continue
+        found.add(object_name)
+    return found
 
 
 def is_shape_curve(object_name):
@@ -438,14 +679,10 @@ def get_k_space(space='world'):
     :param space: <str> the space to get.
     :return: <int> index type.
     """
-    if space == 'world':
-        return space_k_world()
-    elif space == 'object':
-        return space_k_object()
-    elif space == 'transform':
-        return space_k_transform()
-    else:
+    k_space = _K_SPACE.get(space)
+    if k_space is None:
         raise NotImplementedError("[GetKSpace] :: {}, is invalid.".format(space))
+    return k_space
 
 
 def space_k_world():
@@ -472,37 +709,60 @@ def space_k_transform():
 class ScriptUtil(OpenMaya.MScriptUtil):
     ptr = None
     MATRIX = OpenMaya.MMatrix()
+    INIT_HANDLERS = {
+        'as_double_ptr':        'init_double_ptr',
+        'as_float_ptr':         'init_float_ptr',
+        'as_float2_ptr':        'init_float2_ptr',
+        'as_double2_ptr':       'init_double2_ptr',
+        'as_double3_ptr':       'init_double3_ptr',
+        'as_float3_ptr':        'init_float3_ptr',
+        'as_int_ptr':           'init_int_ptr',
+        'as_uint_ptr':          'init_uint_ptr',
+        'matrix_from_list':     'matrix_from_list',
+        }
 
     def __init__(self, *a, **kw):
         super(ScriptUtil, self).__init__(*a)
-        if 'as_double_ptr' in kw:
-            self.createFromDouble(*a)
-            self.ptr = self.asDoublePtr()
-        if 'as_float_ptr' in kw:
-            self.createFromDouble(*a)
-            self.ptr = self.asFloatPtr()
-        if 'as_float2_ptr' in kw:
-            # self.createFromDouble(*a)
-            self.ptr = self.asFloat2Ptr()
-        if 'as_double2_ptr' in kw:
-            self.createFromList([0.0, 0.0], 2)
-            self.ptr = self.asDouble2Ptr()
-        if 'as_double3_ptr' in kw:
-            self.createFromList([0.0, 0.0, 0.0], 3)
-            self.ptr = self.asDouble3Ptr()
-        if 'as_float3_ptr' in kw:
-            self.createFromList([0.0, 0.0, 0.0], 3)
-            self.ptr = self.asFloat3Ptr()
-        if 'as_int_ptr' in kw:
-            self.ptr = self.asIntPtr()
-        if 'as_uint_ptr' in kw:
-            self.ptr = self.asUintPtr()
-        if 'matrix_from_list' in kw:
-            self.matrix_from_list(*a)
+        # the double pointer is the most common request
+        if len(kw) == 1 and 'as_double_ptr' in kw:
+            self.init_double_ptr(*a)
+            return
+        for key in kw:
+            if key in self.INIT_HANDLERS:
+                getattr(self, self.INIT_HANDLERS[key])(*a)
         if 'function' in kw:
             if callable(kw['function'][0]):
                 self.execute(kw['function'])
 
+    def init_double_ptr(self, *a):
+        self.createFromDouble(*a)
+        self.ptr = self.asDoublePtr()
+
+    def init_float_ptr(self, *a):
+        self.createFromDouble(*a)
+        self.ptr = self.asFloatPtr()
+
+    def init_float2_ptr(self, *a):
+        self.ptr = self.asFloat2Ptr()
+
+    def init_double2_ptr(self, *a):
+        self.createFromList([0.0, 0.0], 2)
+        self.ptr = self.asDouble2Ptr()
+
+    def init_double3_ptr(self, *a):
+        self.createFromList([0.0, 0.0, 0.0], 3)
+        self.ptr = self.asDouble3Ptr()
+
+    def init_float3_ptr(self, *a):
+        self.createFromList([0.0, 0.0, 0.0], 3)
+        self.ptr = self.asFloat3Ptr()
+
+    def init_int_ptr(self, *a):
+        self.ptr = self.asIntPtr()
+
+    def init_uint_ptr(self, *a):
+        self.ptr = self.asUintPtr()
+
     def execute(self, function=()):
         function[0](*[self.ptr] + list(function[1:]))
 
@@ -611,7 +871,7 @@ def connect_attr(src_attribute="", dst_attribute=""):
     perform connection
     :return: <bool> True for success. <bool> False for failure.
     """
-    if not cmds.isConnected(src_attribute, dst_attribute):
+    if not is_plug_connected(src_attribute, dst_attribute):
         cmds.connectAttr(src_attribute, dst_attribute)
     return True
 
@@ -642,9 +902,9 @@ def get_m_obj_array(objects=()):
     :return: <OpenMaya.MObjectArray>
     """
     m_array = OpenMaya.MObjectArray()
-    for idx, obj in enumerate(objects):
-        if is_exists(obj):
-            m_array.insert(get_m_obj(obj), idx)
+    # objects that do not exist are left out
+    for m_obj in get_m_objs(objects, skip_missing=True):
+        m_array.append(m_obj)
     return m_array
 
 
@@ -655,8 +915,8 @@ def get_m_shape_obj_array(objects=()):
     :return:
     """
     m_array = OpenMaya.MObjectArray()
-    for obj in objects:
-        m_array.append(get_shape_obj(obj)[0])
+    for m_obj in get_m_objs(objects):
+        m_array.append(get_m_shape(m_obj)[0])
     return m_array
 
 
@@ -665,14 +925,13 @@ def convert_obj_array_to_string_array(object_array):
     returns the string version of the MObjectArray
     :return:
     """
-    objects = ()
-    try:
-        for i in xrange(len(object_array)):
-            objects += get_m_object_name(object_array[i]),
-    except TypeError:
-        for i in xrange(object_array.length()):
-            objects += get_m_object_name(object_array[i]),
-    return objects
+    # OpenMaya arrays have no len(), probe for the length method instead of catching the TypeError
+    length = getattr(object_array, 'length', None)
+    array_len = length() if callable(length) else len(object_array)
+    objects = [None] * array_len
+    for i in xrange(array_len):
+        objects[i] = get_m_object_name(object_array[i])
+    return tuple(objects)
 
 
 def rename_node(object_name, this_name):
@@ -688,6 +947,21 @@ def rename_node(object_name, this_name):
     return this_name
 
 
+def rename_nodes(object_names=(), new_names=()):
+    """
+    renames each of the object names to the new name at the same index, through one modifier.
+    :param object_names: <tuple> array of objects to rename.
+    :param new_names: <tuple> array of new names.
+    :return: <tuple> the names the nodes were given, Maya may number names that clash.
+    """
+    m_objects = [get_m_obj(object_name) for object_name in object_names]
+    m_dag_mod = OpenMaya.MDagModifier()
+    for m_object, this_name in zip(m_objects, new_names):
+        m_dag_mod.renameNode(m_object, this_name)
+    m_dag_mod.doIt()
+    return tuple([OpenMaya.MFnDependencyNode(m_object).name() for m_object in m_objects])
+
+
 def remove_node(object_name):
     """
     removes the node(s) form the Maya scene.
@@ -705,22 +979,13 @@ def remove_node(object_name):
                 # object  already deleted
                 continue
 
-    elif isinstance(object_name, (str, unicode)) and is_exists(object_name):
+    elif isinstance(object_name, string_types) and is_exists(object_name):
             node = get_m_obj(object_name)
             m_dag_mod.deleteNode(node)
             m_dag_mod.doIt()
     return True
 
 
-def get_m_object_name(m_object=OpenMaya.MObject):
-    """
-    get the object name string.
-    :param m_object: <OpenMaya.MObject> get the string of this object node.
-    :return: <str> object name.
-    """
-    return OpenMaya.MFnMFnDependencyNode(m_object).name()
-
-
 def get_plug(object_name, attr_str):
     """
     get the MPlug from object attribute name.
@@ -734,10 +999,12 @@ def get_plug(object_name, attr_str):
 def get_object_types(find_str=""):
     """
     return a list of all OpenMaya object types.
-    :return: <list> of object_type.
+    :param find_str: <str> get only the object types containing this name.
+    :return: <tuple> of object_type.
     """
-    k_objects = filter(lambda k: k.startswith('k'), dir(OpenMaya.MFn))
-    return filter(lambda k: find_str in k, k_objects)
+    if find_str not in __object_types_cache__:
+        __object_types_cache__[find_str] = tuple(k for k in _K_OBJECTS if find_str in k)
+    return __object_types_cache__[find_str]
 
 
 def get_m_anim_from_sel(object_node="", as_strings=False):
@@ -751,13 +1018,14 @@ def get_m_anim_from_sel(object_node="", as_strings=False):
         object_node = get_selected_node()
     anim_nodes = {}
     anim_curve_nodes = get_connected_nodes(
-            object_name=object_node, find_node_type=OpenMaya.MFn.kAnimCurve, as_strings=as_strings,
+            object_name=object_node, find_node_type=_K_ANIM_CURVE, as_strings=as_strings,
             down_stream=False, up_stream=True)
     for anim in anim_curve_nodes:
         if as_strings:
             anim_nodes[anim] = get_m_obj(anim)
         else:
-            anim_nodes[get_m_object_name(anim)] = OpenMayaAnim.MFnAnimCurve(anim)
+            anim_fn = OpenMayaAnim.MFnAnimCurve(anim)
+            anim_nodes[anim_fn.name()] = anim_fn
     return anim_nodes
 
 
@@ -767,26 +1035,39 @@ def get_m_object_name(m_object=None):
     :param m_object: <OpenMaya.MObject> maya object.
     :return: <str> node name.
     """
-    node_fn = OpenMaya.MFnDependencyNode(m_object)
-    return node_fn.name()
+    m_handle = OpenMaya.MObjectHandle(m_object)
+    m_hash = m_handle.hashCode()
+    m_name = get_cached_handle_value(__name_cache__, m_hash, m_handle)
+    if m_name is not None:
+        return m_name
+    return cache_handle_value(__name_cache__, m_hash, m_handle, OpenMaya.MFnDependencyNode(m_object).name())
 
 
 def compare_objects(object_1, object_2, fn=False, shape_type=False):
     """
     compare two objects
-    :param object_1: <str>
-    :param object_2: <str>
-    :param fn: <bool> compare function set.
-    :param shape_type: <bool> compare shape function set.
+    :param object_1: <str>, <OpenMaya.MObject>
+    :param object_2: <str>, <OpenMaya.MObject>
+    :param fn: <bool> compare the api types.
+    :param shape_type: <bool> compare the shape api types.
     :return: <bool> True for success. <bool> False for failure.
     """
     object_1 = get_m_obj(object_1)
     object_2 = get_m_obj(object_2)
     if fn:
-        return get_fn(object_1) == get_fn(object_2)
+        return object_1.apiType() == object_2.apiType()
     if shape_type:
-        return get_shape_name(object_1) == get_shape_name(object_2)
-    return False
+        return get_shape_api_types(object_1) == get_shape_api_types(object_2)
+    return OpenMaya.MObjectHandle(object_1) == OpenMaya.MObjectHandle(object_2)
+
+
+def get_shape_api_types(m_object=None):
+    """
+    get the api types of the shapes under this object.
+    :param m_object: <OpenMaya.MObject> the object to get the shapes from.
+    :return: <tuple> array of api type ids.
+    """
+    return tuple([m_shape.apiType() for m_shape in get_m_shape(m_object)])
 
 
 def get_scene_objects(name='', as_strings=False, node_type='', find_attr='', dag=False):
@@ -799,39 +1080,54 @@ def get_scene_objects(name='', as_strings=False, node_type='', find_attr='', dag
     :param dag: <bool> if set to True, get only the transform items.
     :return: <list> of scene items. <bool> False for failure.
     """
-    scene_it = OpenMaya.MItDependencyNodes()
-    items = ()
-    while not scene_it.isDone():
-        cur_item = scene_it.item()
-        if not cur_item.isNull():
-            if as_strings:
-                o_name = get_m_object_name(cur_item)
-            else:
-                o_name = cur_item
-            if dag and has_fn(cur_item, 'dag'):
-                if node_type and has_fn(cur_item, node_type):
-                    if name and name in o_name:
-                        items += o_name,
-                    else:
-                        items += o_name,
-                elif not node_type:
-                    items += o_name,
-            elif not dag:
-                if node_type and has_fn(cur_item, node_type):
-                    if name and name in o_name:
-                        items += o_name,
-                    else:
-                        items += o_name,
-                elif not node_type:
-                    items += o_name,
-        scene_it.next()
+    # the scene items are stored until a node is added, removed or renamed
+    cache_key = node_type, dag, as_strings
+    items = __scene_objects_cache__.get(cache_key)
+    if items is None:
+        items = cache_value(__scene_objects_cache__, cache_key, _iterate_scene_objects(node_type, dag, as_strings))
+
+    # filter all items that contains this name
+    if name:
+        names = items if as_strings else [get_m_object_name(o) for o in items]
+        items = [items[i] for i in array_utils.find_names(names, name)]
 
     # filter all items that contains this attribute name
     if find_attr:
-        items = filter(lambda x: has_attr(x, find_attr), items)
+        items = [x for x in items if has_attr(x, find_attr)]
+    return tuple(items)
+
+
+def _iterate_scene_objects(node_type='', dag=False, as_strings=False):
+    """
+    iterates the scene for the node type given.
+    :param node_type: <str> find this node type in the current scene.
+    :param dag: <bool> if set to True, get only the dag items.
+    :param as_strings: <bool> return a list of node strings instead of a list of OpenMaya.MObject(s).
+    :return: <tuple> of scene items.
+    """
+    # let the iterator filter the node types instead of checking each node in the scene
+    if node_type:
+        fn_id = _NODE_GET(node_type, node_type if isinstance(node_type, int) else None)
+        if fn_id is None:
+            return ()
+        scene_it = OpenMaya.MItDependencyNodes(fn_id)
+    elif dag:
+        scene_it = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kDagNode)
+    else:
+        scene_it = OpenMaya.MItDependencyNodes()
+    check_dag = dag and node_type
 
-    # flatten the resultant array
-    return tuple(flatten(items))
+    items = []
+    while not scene_it.isDone():
+        cur_item = scene_it.item()
+        scene_it.next()
+        if cur_item.isNull() or check_dag and not cur_item.hasFn(_K_DAG):
+            continue
+        if as_strings:
+            items.append(get_m_object_name(cur_item))
+        else:
+            items.append(cur_item)
+    return tuple(items)
 
 
 def check_fn_shape(m_object=None, m_type=None):
@@ -854,11 +1150,11 @@ def check_fn_shape(m_object=None, m_type=None):
 
 def type_exists(shape_type):
     """
-    checks if the shape type name is valid.
-    :param shape_type: <str> the shape type to check.
+    checks if the shape type name, or the OpenMaya.MFn type id is valid.
+    :param shape_type: <str>, <OpenMaya.MFn.kType> the shape type to check.
     :return: <bool> True for yes. <bool> False for no.
     """
-    return shape_type in node_types
+    return shape_type in _NODE_TYPE_SET or shape_type in _NODE_FN_VALUES
 
 
 def check_shape_type_name(m_object=None, shape_type=None):
@@ -869,8 +1165,9 @@ def check_shape_type_name(m_object=None, shape_type=None):
     :return: <bool> True for yes. <bool> False for no.
     """
     m_object = get_m_obj(m_object)
-    if type_exists(shape_type):
-        return check_fn_shape(m_object, m_type=node_types[shape_type])
+    m_type = _NODE_GET(shape_type)
+    if m_type is not None:
+        return check_fn_shape(m_object, m_type=m_type)
     return False
 
 
@@ -883,21 +1180,22 @@ def get_parents(object_name=None, stop_at=''):
     """
     m_object = get_m_obj(object_name)
     fn_object = OpenMaya.MFnDagNode(m_object)
-    return_data = ()
-    par_count = fn_object.parentCount()
-    if par_count:
-        o_arr = OpenMaya.MDagPathArray()
-        fn_object.getAllPaths(o_arr)
-        length = o_arr.length()
-        for i in xrange(length):
-            m_path = o_arr[i]
-            p_node_ls = m_path.fullPathName().split('|')
-            p_node_ls.reverse()
-            for p in p_node_ls:
-                return_data += p,
-                if p == stop_at:
-                    break
-    return return_data
+    object_name = fn_object.name()
+    return_data = []
+    for i in xrange(fn_object.parentCount()):
+        return_data.append(object_name)
+        if object_name == stop_at:
+            continue
+        # walk up the hierarchy until the stop_at node, or the world node is reached
+        m_parent = fn_object.parent(i)
+        while not m_parent.hasFn(OpenMaya.MFn.kWorld):
+            fn_parent = OpenMaya.MFnDagNode(m_parent)
+            p_name = fn_parent.name()
+            return_data.append(p_name)
+            if p_name == stop_at:
+                break
+            m_parent = fn_parent.parent(0)
+    return tuple(return_data)
 
 
 def convert_list_to_str(array_obj):
@@ -917,7 +1215,7 @@ def convert_str_to_list(array_obj):
     :param array_obj: <tuple>, <list> array object to convert.
     :return: <str> object.
     """
-    if isinstance(array_obj, (str, unicode)) and len(array_obj) == 1:
+    if isinstance(array_obj, string_types) and len(array_obj) == 1:
         return array_obj,
     return array_obj
 
@@ -929,20 +1227,7 @@ def get_fn(m_object):
     :return: <OpenMaya.MFn<ClassType> specific object fn type.
     """
     m_object = convert_list_to_str(m_object)
-    if type_str(m_object) == 'mesh':
-        return OpenMaya.MFnMesh(m_object)
-    elif type_str(m_object) == 'nurbsCurve':
-        return OpenMaya.MFnNurbsCurve(m_object)
-    elif type_str(m_object) == 'nurbsSurface':
-        return OpenMaya.MFnNurbsSurface(m_object)
-    elif type_str(m_object) == 'camera':
-        return OpenMaya.MFnCamera(m_object)
-    elif type_str(m_object) == 'joint':
-        return OpenMayaAnim.MFnIkJoint(m_object)
-    elif type_str(m_object) == 'ikHandle':
-        return OpenMayaAnim.MFnIkEffector(m_object)
-    else:
-        return OpenMaya.MFnDependencyNode(m_object)
+    return _FN_TABLE.get(m_object.apiType(), OpenMaya.MFnDependencyNode)(m_object)
 
 
 def type_str(m_object):
@@ -951,7 +1236,12 @@ def type_str(m_object):
     :param m_object: <OpenMaya.MObject>
     :return: <str> api type name.
     """
-    return OpenMaya.MFnDependencyNode(m_object).typeName()
+    m_handle = OpenMaya.MObjectHandle(m_object)
+    m_hash = m_handle.hashCode()
+    m_type = get_cached_handle_value(__type_str_cache__, m_hash, m_handle)
+    if m_type is not None:
+        return m_type
+    return cache_handle_value(__type_str_cache__, m_hash, m_handle, OpenMaya.MFnDependencyNode(m_object).typeName())
 
 
 def type_int(m_object):
@@ -960,7 +1250,12 @@ def type_int(m_object):
     :param m_object: <OpenMaya.MObject>
     :return: <int> api type.
     """
-    return OpenMaya.MFnDependencyNode(m_object).type()
+    m_handle = OpenMaya.MObjectHandle(m_object)
+    m_hash = m_handle.hashCode()
+    m_type = get_cached_handle_value(__type_int_cache__, m_hash, m_handle)
+    if m_type is not None:
+        return m_type
+    return cache_handle_value(__type_int_cache__, m_hash, m_handle, OpenMaya.MFnDependencyNode(m_object).type())
 
 
 def has_fn(item_name, shape_type):
@@ -970,14 +1265,10 @@ def has_fn(item_name, shape_type):
     :param shape_type: <str>, <OpenMaya.MFn.kType> the type id.
     :return: <bool> True for type is match. <bool> for no match.
     """
-    if isinstance(item_name, (str, unicode)):
+    if isinstance(item_name, string_types):
         item_name = get_m_obj(item_name)
-    if isinstance(shape_type, str):
-        if shape_type not in node_types:
-            return False
-        return item_name.hasFn(node_types[shape_type])
-    if isinstance(shape_type, int):
-        return item_name.hasFn(shape_type)
+    fn = _NODE_GET(shape_type, shape_type if isinstance(shape_type, int) else None)
+    return fn is not None and item_name.hasFn(fn)
 
 
 def has_attr(item_obj, attr_name):
@@ -989,7 +1280,7 @@ def has_attr(item_obj, attr_name):
     """
     if not item_obj:
         return False
-    if isinstance(item_obj, (str, unicode)):
+    if isinstance(item_obj, string_types):
         item_obj = get_m_obj(item_obj)
     return Item(item_obj).has_plug(attr_name)
 
@@ -999,16 +1290,7 @@ def get_shapes_len(m_object=None):
     returns the number of shapes children.
     :return:
     """
-    fn_item = OpenMaya.MFnDagNode(m_object)
-    ch_shapes = ()
-    ch_count = fn_item.childCount()
-    if ch_count:
-        for i in xrange(ch_count):
-            ch_item = fn_item.child(i)
-            if has_fn(ch_item, 'transform'):
-                continue
-            ch_shapes += i,
-    return len(ch_shapes)
+    return len(_shape_children(m_object)[1])
 
 
 def get_m_shape(m_object=None, shape_type="", as_strings=False):
@@ -1019,24 +1301,39 @@ def get_m_shape(m_object=None, shape_type="", as_strings=False):
     :param as_strings: <bool> return as string name array.
     :return: <tuple> array of shape objects.
     """
-    return_items = ()
+    if isinstance(m_object, OpenMaya.MDagPath):
+        m_object = m_object.node()
+    ch_count, ch_shapes = _shape_children(m_object)
+    if ch_count:
+        return_items = [ch_item for ch_item in ch_shapes if not shape_type or has_fn(ch_item, shape_type)]
+    elif has_fn(m_object, shape_type):
+        return_items = [m_object]
+    else:
+        return ()
+    if as_strings:
+        return tuple([get_m_object_name(ch_item) for ch_item in return_items])
+    return tuple(return_items)
+
+
+def _shape_children(m_object=None):
+    """
+    get the child count and the non-transform children of the object, stores the result for the repeated lookups.
+    :param m_object: <OpenMaya.MObject> the MObject to get children from.
+    :return: <int> child count, <tuple> array of shape objects.
+    """
+    m_handle = OpenMaya.MObjectHandle(m_object)
+    m_hash = m_handle.hashCode()
+    shape_children = get_cached_handle_value(__shape_children_cache__, m_hash, m_handle)
+    if shape_children is not None:
+        return shape_children
     fn_item = OpenMaya.MFnDagNode(m_object)
     ch_count = fn_item.childCount()
-    if ch_count:
-        for i in xrange(ch_count):
-            ch_item = fn_item.child(i)
-            if shape_type and not has_fn(ch_item, shape_type):
-                continue
-            if has_fn(ch_item, 'transform'):
-                continue
-            if as_strings:
-                return_items += OpenMaya.MFnDependencyNode(ch_item).name(),
-            elif not as_strings:
-                return_items += ch_item,
-    elif not ch_count:
-        if has_fn(m_object, shape_type):
-            return_items += m_object,
-    return return_items
+    ch_shapes = []
+    for i in xrange(ch_count):
+        ch_item = fn_item.child(i)
+        if not ch_item.hasFn(_K_TRANSFORM):
+            ch_shapes.append(ch_item)
+    return cache_handle_value(__shape_children_cache__, m_hash, m_handle, (ch_count, tuple(ch_shapes)))
 
 
 def get_m_parent(m_object=None, find_parent='', with_shape='', as_strings=False):
@@ -1049,28 +1346,33 @@ def get_m_parent(m_object=None, find_parent='', with_shape='', as_strings=False)
     :return: <list> found objects.
     """
     fn_object = OpenMaya.MFnDagNode(m_object)
-    return_data = ()
+    return_data = []
     par_count = fn_object.parentCount()
     if par_count:
-        if isinstance(find_parent, (str, unicode)):
+        if isinstance(find_parent, string_types):
             o_arr = OpenMaya.MDagPathArray()
             fn_object.getAllPaths(o_arr)
             length = o_arr.length()
+            found = []
             for i in xrange(length):
-                m_path = o_arr[i]
-                p_node_ls = m_path.fullPathName().split('|')
-                found = filter(lambda x: find_parent in x.rpartition(':')[-1], p_node_ls)
-                if found:
-                    if as_strings:
-                        return_data += found,
-                    else:
-                        return_data += get_m_obj(found),
+                # walk up the path comparing the node names, instead of splitting the full path name
+                m_path = OpenMaya.MDagPath(o_arr[i])
+                for _ in xrange(m_path.length()):
+                    p_node = m_path.node()
+                    p_name = OpenMaya.MFnDependencyNode(p_node).name()
+                    if find_parent in p_name.rpartition(':')[-1] and not [f for f in found if f == p_node]:
+                        found.append(p_node)
+                        if as_strings:
+                            return_data.append(p_name)
+                        else:
+                            return_data.append(p_node)
+                    m_path.pop()
         elif isinstance(find_parent, (int, bool)):
             if as_strings:
-                return_data += get_m_object_name(fn_object.parent(0)),
+                return_data.append(get_m_object_name(fn_object.parent(0)))
             else:
-                return_data += fn_object.parent(0),
-    return return_data
+                return_data.append(fn_object.parent(0))
+    return tuple(return_data)
 
 
 def get_m_child(m_object=None, find_child=True, with_type='', with_shape='', transform=False, as_strings=False):
@@ -1084,17 +1386,21 @@ def get_m_child(m_object=None, find_child=True, with_type='', with_shape='', tra
     :return: <list> found objects.
     """
     fn_object = OpenMaya.MFnDagNode(m_object)
-    return_data = ()
+    return_data = []
     ch_count = fn_object.childCount()
     if ch_count:
         m_dag = OpenMaya.MDagPath()
         fn_object.getPath(m_dag)
-        m_iter = OpenMaya.MItDag(OpenMaya.MItDag.kBreadthFirst)
-        m_iter.reset(m_dag)
+        # let the iterator skip the non-transform nodes
+        filter_type = OpenMaya.MFn.kTransform if transform else OpenMaya.MFn.kInvalid
+        m_iter = OpenMaya.MItDag(OpenMaya.MItDag.kDepthFirst, filter_type)
+        m_iter.reset(m_dag, OpenMaya.MItDag.kDepthFirst, filter_type)
+        find_name = with_shape and isinstance(find_child, string_types)
+        shape_fn = node_types[with_shape] if find_name else None
 
         # iterate from the dag path provided
+        o_path = OpenMaya.MDagPath()
         while not m_iter.isDone():
-            o_path = OpenMaya.MDagPath()
             m_iter.getPath(o_path)
             ch_node = o_path.node()
             if as_strings:
@@ -1102,32 +1408,19 @@ def get_m_child(m_object=None, find_child=True, with_type='', with_shape='', tra
             else:
                 ch_item = ch_node
 
-            # return a child that matches a name
-            if isinstance(find_child, (str, unicode)) and find_child in o_path.partialPathName():
-                # find the shape associated with the node object node.
-                if with_shape:
-                    fn_item = OpenMaya.MFnDagNode(m_iter.item())
-                    c_count = fn_item.childCount()
-                    if c_count:
-                        for ch_i in xrange(c_count):
-                            if fn_item.child(ch_i).hasFn(node_types[with_shape]):
-                                return_data += ch_item,
-                else:
-                    if transform:
-                        if has_fn(ch_node, 'transform'):
-                            return_data += ch_item,
-                    else:
-                        return_data += ch_item,
+            # return a child that matches a name, with the shape associated with the node object node.
+            if find_name and find_child in OpenMaya.MFnDependencyNode(ch_node).name():
+                fn_item = OpenMaya.MFnDagNode(ch_node)
+                for ch_i in xrange(fn_item.childCount()):
+                    if fn_item.child(ch_i).hasFn(shape_fn):
+                        return_data.append(ch_item)
+                        break
 
             # return all children
             else:
-                if transform:
-                    if has_fn(ch_node, 'transform'):
-                        return_data += ch_item,
-                else:
-                    return_data += ch_item,
+                return_data.append(ch_item)
             m_iter.next()
-    return return_data
+    return tuple(return_data)
 
 
 def get_children_obj(object_name, type_name=''):
@@ -1143,12 +1436,12 @@ def get_children_obj(object_name, type_name=''):
     if not type_name:
         return children
 
-    proper_children = ()
+    proper_children = []
     for ch in children:
         if not has_fn(ch, type_name):
             continue
-        proper_children += ch,
-    return proper_children
+        proper_children.append(ch)
+    return tuple(proper_children)
 
 
 def get_children_names(object_name, type_name=''):
@@ -1164,12 +1457,12 @@ def get_children_names(object_name, type_name=''):
     if not type_name:
         return children
 
-    proper_children = ()
-    for ch in children:
-        if not has_fn(get_m_obj(ch), type_name):
+    proper_children = []
+    for ch, ch_obj in zip(children, get_m_objs(children)):
+        if not has_fn(ch_obj, type_name):
             continue
-        proper_children += ch,
-    return proper_children
+        proper_children.append(ch)
+    return tuple(proper_children)
 
 
 def get_parent_name(object_name):
@@ -1190,6 +1483,49 @@ def get_parent_obj(object_name):
     return get_transform_relatives(object_name, find_parent=True, as_strings=True)
 
 
+def _get_transform_relatives(m_object, find_parent='', find_child=False, with_shape='', as_strings=False):
+    """
+    get parent/ child transforms relative to the maya object provided.
+    :param m_object: <OpenMaya.MObject> the object to search from.
+    :return: <tuple> found objects.
+    """
+    # transform relatives can only work on kDagNode type
+    if m_object.isNull() or not m_object.hasFn(_K_DAG):
+        return ()
+    if find_parent:
+        return get_m_parent(m_object, find_parent=find_parent, with_shape=with_shape, as_strings=as_strings)
+    return get_m_child(
+        m_object, find_child=find_child, with_shape=with_shape, as_strings=as_strings, transform=True)
+
+
+def get_transform_relatives_many(object_names=(), find_parent='', find_child=False, with_shape='', as_strings=False):
+    """
+    get parent/ child transforms relative to each of the object names provided.
+    the names are resolved together through one selection list.
+    :param object_names: <tuple>, <list> array of object names to search from in the scene.
+    :param find_parent: <str>, <bool>, <int>
+                        find the first parent or find this parent relative to the object names provided.
+    :param find_child: <str>, <bool>, <int>
+                        find all children or find this child relative to the object names provided.
+    :param with_shape: <str> find the transform containing this shape.
+    :param as_strings: <bool> return the data as string objects instead.
+    :return: <dict> found objects, keyed by the object name.
+    """
+    if not object_names:
+        raise ValueError("[GetTransformRelatives] :: object_names parameter is empty.")
+    if not find_parent and not find_child:
+        raise ValueError("[GetTransformRelatives] :: Please supply either find_parent or find_child parameters.")
+
+    object_names = tuple(set(object_names))
+    m_objects = get_m_objs(object_names)
+
+    return_data = {}
+    for object_str, m_object in zip(object_names, m_objects):
+        return_data[object_str] = _get_transform_relatives(
+            m_object, find_parent=find_parent, find_child=find_child, with_shape=with_shape, as_strings=as_strings)
+    return return_data
+
+
 def get_transform_relatives(object_name='', find_parent='', find_child=False, with_shape='', as_strings=False):
     """
     get parent/ child transforms relative to the object name provided.
@@ -1208,24 +1544,9 @@ def get_transform_relatives(object_name='', find_parent='', find_child=False, wi
     if not find_parent and not find_child:
         raise ValueError("[GetTransformRelatives] :: Please supply either find_parent or find_child parameters.")
 
-    # define variables
-    return_data = ()
-    m_object = get_m_obj(object_name)
-
-    # transform relatives can only work on kDagNode type
-    if not has_fn(m_object, 'dag'):
-        return ()
-
-    if m_object:
-        if find_parent:
-            return_data += tuple(get_m_parent(
-                m_object, find_parent=find_parent, with_shape=with_shape, as_strings=as_strings)
-            )
-        elif find_child:
-            return_data += tuple(get_m_child(
-                m_object, find_child=find_child, with_shape=with_shape, as_strings=as_strings, transform=True)
-            )
-    return return_data
+    return _get_transform_relatives(
+        get_m_obj(object_name), find_parent=find_parent, find_child=find_child,
+        with_shape=with_shape, as_strings=as_strings)
 
 
 def get_connected_nodes(object_name="", find_node_type='animCurve',
@@ -1260,8 +1581,8 @@ def get_connected_nodes(object_name="", find_node_type='animCurve',
         level = OpenMaya.MItDependencyGraph.kNodeLevel
 
     if isinstance(object_name, (list, tuple)):
-        node = object_name[0]
-    if isinstance(object_name, (str, unicode)):
+        node = get_m_objs(object_name[:1])[0]
+    if isinstance(object_name, string_types):
         node = get_m_obj(object_name)
     elif isinstance(object_name, OpenMaya.MObject):
         node = object_name
@@ -1271,7 +1592,90 @@ def get_connected_nodes(object_name="", find_node_type='animCurve',
     # find the node type associated with the string
     if find_node_type and isinstance(find_node_type, str):
         find_node_type = node_types[find_node_type]
+    return _get_connected_from_mobject(node, find_node_type, direction, level,
+                                       find_attr=find_attr, with_shape=with_shape, as_strings=as_strings)
+
+
+def _get_connected_from_mobject(node, find_node_type=None, direction=OpenMaya.MItDependencyGraph.kDownstream,
+                                level=OpenMaya.MItDependencyGraph.kPlugLevel, find_attr="", with_shape=None,
+                                as_strings=False):
+    """
+    get connected nodes from the MObject provided, the arguments are already resolved.
+    :param node: <OpenMaya.MObject> the node to start searching from.
+    :param find_node_type: <OpenMaya.MFn> kObjectName type to find.
+    :param direction: <OpenMaya.MItDependencyGraph.Direction> the direction to search in.
+    :param level: <OpenMaya.MItDependencyGraph.Level> node or plug level.
+    :param find_attr: <str> find the node containing this attribute name.
+    :param with_shape: <str> shape name.
+    :param as_strings: <bool> return as string objects instead.
+    :return: <tuple> connected nodes.
+    """
+    # there is no scene wide message for added or removed attributes, so these lookups are not stored
+    if find_attr:
+        return tuple(_iter_connected(node, find_node_type, direction, level,
+                                     find_attr=find_attr, with_shape=with_shape, as_strings=as_strings))
+
+    # the results are stored until the connections or the dag hierarchy in the scene change
+    m_handle = OpenMaya.MObjectHandle(node)
+    cache_key = (m_handle.hashCode(), find_node_type, direction, level, find_attr, with_shape, as_strings)
+    found_nodes = get_cached_handle_value(__connections_cache__, cache_key, m_handle)
+    if found_nodes is not None:
+        return found_nodes
+    found_nodes = tuple(_iter_connected(node, find_node_type, direction, level,
+                                        find_attr=find_attr, with_shape=with_shape, as_strings=as_strings))
+    return cache_handle_value(__connections_cache__, cache_key, m_handle, found_nodes)
+
+
+def _iter_connected(node, find_node_type=None, direction=OpenMaya.MItDependencyGraph.kDownstream,
+                    level=OpenMaya.MItDependencyGraph.kPlugLevel, find_attr="", with_shape=None, as_strings=False):
+    """
+    connected nodes generator, stops walking the dependency graph as soon as the caller stops asking.
+    :param node: <OpenMaya.MObject> the node to start searching from.
+    :param find_node_type: <OpenMaya.MFn> kObjectName type to find.
+    :param direction: <OpenMaya.MItDependencyGraph.Direction> the direction to search in.
+    :param level: <OpenMaya.MItDependencyGraph.Level> node or plug level.
+    :param find_attr: <str> find the node containing this attribute name.
+    :param with_shape: <str> shape name.
+    :param as_strings: <bool> yield string objects instead.
+    :return: <OpenMaya.MObject>, <str> connected node.
+    """
+    # iterate the dependency graph to find what we want.
+    for cur_item, cur_fn, cur_name in _iter_dep_graph(node, find_node_type, direction, level):
+        if find_attr and not _has_custom_attr(cur_fn, find_attr):
+            continue
+        if with_shape and not check_fn_shape(cur_item, with_shape):
+            continue
+        if as_strings:
+            yield cur_name
+        else:
+            yield cur_item
+
+
+def _has_custom_attr(node_fn, find_attr):
+    """
+    check if the node has a user defined attribute containing this name.
+    :param node_fn: <OpenMaya.MFnDependencyNode> the node function set.
+    :param find_attr: <str> the attribute name to look for.
+    :return: <bool> True for found. <bool> False for not found.
+    """
+    attr_fn = OpenMaya.MFnAttribute()
+    for a_i in xrange(node_fn.attributeCount()):
+        attr_fn.setObject(node_fn.attribute(a_i))
+        if attr_fn.isDynamic() and find_attr in attr_fn.name():
+            return True
+    return False
 
+
+def _iter_dep_graph(node, find_node_type=None, direction=OpenMaya.MItDependencyGraph.kDownstream,
+                    level=OpenMaya.MItDependencyGraph.kPlugLevel):
+    """
+    dependency graph generator.
+    :param node: <OpenMaya.MObject> the node to start searching from.
+    :param find_node_type: <OpenMaya.MFn> kObjectName type to find.
+    :param direction: <OpenMaya.MItDependencyGraph.Direction> the direction to search in.
+    :param level: <OpenMaya.MItDependencyGraph.Level> node or plug level.
+    :return: <OpenMaya.MObject> node, <OpenMaya.MFnDependencyNode> node function set, <str> node name.
+    """
     if find_node_type:
         dag_iter = OpenMaya.MItDependencyGraph(
             node,
@@ -1285,44 +1689,11 @@ def get_connected_nodes(object_name="", find_node_type='animCurve',
             level)
     dag_iter.reset()
 
-    # iterate the dependency graph to find what we want.
-    found_nodes = ()
     while not dag_iter.isDone():
         cur_item = dag_iter.currentItem()
         cur_fn = OpenMaya.MFnDependencyNode(cur_item)
-        cur_name = cur_fn.name()
-        if find_attr:
-            attrs = attribute_utils.Attributes(cur_name, custom=1)
-            if attrs:
-                find_relevant_attr = filter(lambda x: find_attr in x, attrs.keys)
-                if find_relevant_attr:
-                    if as_strings:
-                        if with_shape:
-                            if check_fn_shape(cur_item, with_shape):
-                                found_nodes += cur_name,
-                        else:
-                            found_nodes += cur_name,
-                    else:
-                        if with_shape:
-                            if check_fn_shape(cur_item, with_shape):
-                                found_nodes += cur_item,
-                        else:
-                            found_nodes += cur_item,
-        else:
-            if as_strings:
-                if with_shape:
-                    if check_fn_shape(cur_item, with_shape):
-                        found_nodes += cur_name,
-                else:
-                    found_nodes += cur_name,
-            else:
-                if with_shape:
-                    if check_fn_shape(cur_item, with_shape):
-                        found_nodes += cur_name,
-                else:
-                    found_nodes += cur_item,
+        yield cur_item, cur_fn, cur_fn.name()
         dag_iter.next()
-    return tuple(found_nodes)
 
 
 def get_connected_anim(object_name=""):
@@ -1333,11 +1704,11 @@ def get_connected_anim(object_name=""):
     """
     anim_c = cmds.listConnections(object_name, s=1, d=0, type='animCurve')
     anim_b = cmds.listConnections(object_name, s=1, d=0, type='blendWeighted')
-    anim_curves = ()
+    anim_curves = []
     if not anim_c and anim_b:
         for blend_node in anim_b:
-            anim_curves += tuple(cmds.listConnections(blend_node, s=1, d=0, type='animCurve'))
-        return anim_curves
+            anim_curves.extend(cmds.listConnections(blend_node, s=1, d=0, type='animCurve'))
+        return tuple(anim_curves)
     else:
         return anim_c
 
@@ -1383,18 +1754,52 @@ def get_m_obj(object_str):
     :param object_str: <str> get the MObject from this parameter given.
     :return: <OpenMaya.MObject> the maya object.
     """
-    if isinstance(object_str, (unicode, str)):
+    if isinstance(object_str, string_types):
+        # the name lookups are stored, the handle is checked in case the node has been deleted
+        m_handle = __m_obj_cache__.get(object_str)
+        if m_handle is not None and m_handle.isValid():
+            return m_handle.object()
         try:
             om_sel = OpenMaya.MSelectionList()
             om_sel.add(object_str)
             node = OpenMaya.MObject()
             om_sel.getDependNode(0, node)
-            return node
         except:
             raise RuntimeError('[Get MObject] :: failed on {}'.format(object_str))
+        cache_value(__m_obj_cache__, object_str, OpenMaya.MObjectHandle(node))
+        return node
     return object_str
 
 
+def get_m_objs(object_names=(), skip_missing=False):
+    """
+    get the MObjects of all the names given through one selection list.
+    the objects are returned in the order of the names given, one for each name.
+    :param object_names: <tuple>, <list> array of object names.
+    :param skip_missing: <bool> leave out the names not found in the scene, instead of raising.
+    :return: <tuple> array of OpenMaya.MObject(s).
+    """
+    om_sel = OpenMaya.MSelectionList()
+    found_names = []
+    for object_str in object_names:
+        try:
+            om_sel.add(object_str)
+        except RuntimeError:
+            if skip_missing:
+                continue
+            raise RuntimeError('[Get MObject] :: failed on {}'.format(object_str))
+        found_names.append(object_str)
+    # the selection list merges names pointing to the same node, resolve these one by one instead
+    if om_sel.length() != len(found_names):
+        return tuple(get_m_obj(object_str) for object_str in found_names)
+    m_objects = []
+    for i in xrange(om_sel.length()):
+        node = OpenMaya.MObject()
+        om_sel.getDependNode(i, node)
+        m_objects.append(node)
+    return tuple(m_objects)
+
+
 def get_m_dag(object_str=""):
     """
     get MDagPath from MObject.
@@ -1419,7 +1824,7 @@ def get_mfn_obj(m_obj=None):
     :param m_obj: <MObject> m object node.
     :return: <MFnDependencyNode>
     """
-    if isinstance(m_obj, basestring):
+    if isinstance(m_obj, string_types):
         return OpenMaya.MFnDependencyNode(get_m_obj(m_obj))
     elif isinstance(m_obj, OpenMaya.MObject):
         return OpenMaya.MFnDependencyNode(m_obj)
@@ -1431,7 +1836,7 @@ def get_mfn_dag(m_obj=None):
     :param m_obj: <MObject> m object node.
     :return: <MFnDependencyNode>
     """
-    if isinstance(m_obj, basestring):
+    if isinstance(m_obj, string_types):
         return OpenMaya.MFnDagNode(get_m_obj(m_obj))
     elif isinstance(m_obj, OpenMaya.MObject):
         return OpenMaya.MFnDagNode(m_obj)
@@ -1443,31 +1848,77 @@ def get_m_dag_path(m_obj=None):
     :param m_obj: <MObject> m object node.
     :return: <MFnDependencyNode>
     """
-    if isinstance(m_obj, basestring):
+    if isinstance(m_obj, string_types):
         return OpenMaya.MDagPath.getAPathTo(get_m_obj(m_obj))
     elif isinstance(m_obj, OpenMaya.MObject):
         return OpenMaya.MDagPath.getAPathTo(m_obj)
 
 
-def get_mesh_points(object_name):
+def get_m_mesh_points(object_name, space='object'):
+    """
+    get the mesh points in one call.
+    :param object_name: <str> find the vertices from this object.
+    :param space: <str> the space to get the points in.
+    :return: <OpenMaya.MPointArray> mesh points.
+    """
+    mesh_fn, mesh_ob, mesh_dag = get_mesh_fn(object_name)
+    mesh_points = OpenMaya.MPointArray()
+    mesh_fn.getPoints(mesh_points, get_k_space(space))
+    vprint("[Number of Vertices] :: {}".format(mesh_points.length()))
+    return mesh_points
+
+
+def get_mesh_points(object_name, space='object'):
     """
     mesh points
     :param object_name: <str> find the vertices from this object.
+    :param space: <str> the space to get the points in.
     :return: <list> mesh vertex list.
     """
-    mesh_fn, mesh_ob, mesh_dag = get_mesh_fn(object_name)
-    mesh_it = OpenMaya.MItMeshVertex(mesh_ob)
-    mesh_vertexes = []
-    vprint("[Number of Vertices] :: {}".format(mesh_fn.numVertices()))
-    while not mesh_it.isDone():
-        mesh_vertexes.append(mesh_it.position())
-        mesh_it.next()
-    return mesh_vertexes
+    mesh_points = get_m_mesh_points(object_name, space=space)
+    return [OpenMaya.MPoint(mesh_points[i]) for i in xrange(mesh_points.length())]
+
+
+def get_mesh_points_array(object_name, space='object'):
+    """
+    mesh points as an array of x, y, z rows.
+    :param object_name: <str> find the vertices from this object.
+    :param space: <str> the space to get the points in.
+    :return: <numpy.ndarray> (N, 3) array, <list> of coordinate tuples when numpy is not available.
+    """
+    if isinstance(object_name, string_types):
+        return array_utils.get_point_rows(get_m_mesh_points2(object_name, space=space))
+    return array_utils.get_point_rows(get_m_mesh_points(object_name, space=space))
+
+
+def get_mesh_centroid(object_name, space='object'):
+    """
+    get the average position of the mesh points.
+    :param object_name: <str> find the vertices from this object.
+    :param space: <str> the space to get the points in.
+    :return: <tuple> x, y, z centroid.
+    """
+    return array_utils.get_point_centroid(get_mesh_points_array(object_name, space=space))
+
+
+def get_m_mesh_points2(object_name, space='object'):
+    """
+    get the mesh points through the Maya Python API 2.0, which returns the arrays directly.
+    :param object_name: <str> find the vertices from this object.
+    :param space: <str> the space to get the points in.
+    :return: <OpenMaya2.MPointArray> mesh points.
+    """
+    m_sel = OpenMaya2.MSelectionList()
+    m_sel.add(object_name)
+    m_dag = m_sel.getDagPath(0)
+    if not m_dag.hasFn(OpenMaya2.MFn.kMesh):
+        m_dag.extendToShape()
+    return OpenMaya2.MFnMesh(m_dag).getPoints(_K_SPACE2[space])
 
 
 def get_mesh_points_cmds(object_name):
     """
-    Mesh points
+    Mesh points. Deprecated, builds a string per vertex, use get_mesh_points instead.
     :param object_name:
     :return:
     """
@@ -1494,7 +1945,7 @@ def get_mesh_fn(target):
     :return <OpenMaya.MFnMesh>, mesh shape fn, <OpenMaya.MObject> shape object, <OpenMaya.MDagPath> the dag path.
     """
 
-    if isinstance(target, str) or isinstance(target, unicode):
+    if isinstance(target, string_types):
         slls = OpenMaya.MSelectionList()
         slls.add(target)
         ground_path = OpenMaya.MDagPath()
@@ -1530,8 +1981,7 @@ def create_container(name="", nodes=()):
     if not cmds.objExists(name):
         cmds.container(name=name)
     if cmds.objectType(name) == 'container':
-        for node in nodes:
-            cmds.container(name, edit=True, addNode=node)
+        cmds.container(name, edit=True, addNode=list(nodes))
     else:
         return False
     return True
@@ -1564,6 +2014,40 @@ def get_object_transform(object_name, m=False, t=False, ws=True):
     return cmds.xform(object_name, m=m, t=t, ws=ws, q=1)
 
 
+def get_world_matrix_list(object_name):
+    """
+    get the world matrix through the dag path, the same values as cmds.xform(m=1, ws=1, q=1).
+    :param object_name: <str> object name to use.
+    :return: <list> matrix list.
+    """
+    m_matrix = get_m_dag(object_name).inclusiveMatrix()
+    return [m_matrix(r, c) for r in xrange(4) for c in xrange(4)]
+
+
+def get_world_translation_list(object_name):
+    """
+    get the world translation through the transform function set, the same values as cmds.xform(t=1, ws=1, q=1).
+    :param object_name: <str> object name to use.
+    :return: <list> translation list.
+    """
+    m_vector = OpenMaya.MFnTransform(get_m_dag(object_name)).getTranslation(OpenMaya.MSpace.kWorld)
+    return [m_vector.x, m_vector.y, m_vector.z]
+
+
+def get_rotation_list(object_name):
+    """
+    get the local rotation through the transform function set, the same values as cmds.xform(ro=1, q=1).
+    the values are in the scene angle unit.
+    :param object_name: <str> object name to use.
+    :return: <list> rotation list.
+    """
+    m_euler = OpenMaya.MEulerRotation()
+    OpenMaya.MFnTransform(get_m_dag(object_name)).getRotation(m_euler)
+    ui_unit = OpenMaya.MAngle.uiUnit()
+    return [OpenMaya.MAngle(value, OpenMaya.MAngle.kRadians).asUnits(ui_unit)
+            for value in (m_euler.x, m_euler.y, m_euler.z)]
+
+
 def snap_to_transform(source="", target="", matrix=False, translate=False, rotation=False):
     """
     grabs matrix information from target and applies to source transform.
@@ -1580,15 +2064,13 @@ def snap_to_transform(source="", target="", matrix=False, translate=False, rotat
         target = get_selected_node(single=False)[-1]
     if not source or not target:
         return False
+    # query through the api, set through cmds so the changes can be undone
     if matrix:
-        s_xform = cmds.xform(target, m=1, ws=1, q=1)
-        cmds.xform(source, m=s_xform, ws=1)
+        cmds.xform(source, m=get_world_matrix_list(target), ws=1)
     if translate:
-        s_xform = cmds.xform(target, t=1, ws=1, q=1)
-        cmds.xform(source, t=s_xform, ws=1)
+        cmds.xform(source, t=get_world_translation_list(target), ws=1)
     if rotation:
-        s_xform = cmds.xform(target, ro=1, q=1)
-        cmds.xform(source, ro=s_xform)
+        cmds.xform(source, ro=get_rotation_list(target))
     return True
 
 
@@ -1610,8 +2092,8 @@ def insert_transform(sel_obj='', name='', suffix_name=''):
         i_name = sel_obj + '_{}'.format(suffix_name)
     else:
         i_name = sel_obj + '_par'
-    mat = cmds.xform(sel_obj, q=1, ws=1, m=1)
     if not cmds.ls(i_name):
+        mat = get_world_matrix_list(sel_obj)
         grp = cmds.group(name=i_name, em=1)
         p_object = get_transform_relatives(sel_obj, find_parent=True)
         cmds.xform(grp, m=mat)
@@ -1643,23 +2125,32 @@ def get_driver_object(object_name="", plugs=False):
     :param plugs: <bool> find plugs from the object name.
     :return: <str>, <tuple> based on arguments given.
     """
-    m_obj = get_connected_nodes(object_name,
-                                find_node_type=OpenMaya.MFn.kTransform,
-                                up_stream=True,
-                                down_stream=False)
-    m_object = m_obj[0]
-    cur_fn = OpenMaya.MFnDependencyNode(m_object)
-    cur_name = cur_fn.name()
-
-    connected_plugs = ()
-    for i in range(cur_fn.attributeCount()):
-        a_obj = cur_fn.attribute(i)
-        m_plug = OpenMaya.MPlug(m_object, a_obj)
-        connected_plugs += m_plug.name(),
+    m_obj = next(_iter_connected(get_m_obj(object_name),
+                                 find_node_type=_K_TRANSFORM,
+                                 direction=OpenMaya.MItDependencyGraph.kUpstream), None)
+    if m_obj is None:
+        return () if plugs else ""
+    cur_fn = OpenMaya.MFnDependencyNode(m_obj)
     if not plugs:
-        return cur_name
+        return cur_fn.name()
     else:
-        return connected_plugs
+        m_plug_array = get_connected_plugs(cur_fn)
+        return tuple([m_plug_array[i].name() for i in xrange(m_plug_array.length())])
+
+
+def get_connected_plugs(node_fn):
+    """
+    get the plugs of the node that have connections, in one call instead of creating a plug per attribute.
+    :param node_fn: <OpenMaya.MFnDependencyNode> the node function set.
+    :return: <OpenMaya.MPlugArray> the connected plugs.
+    """
+    m_plug_array = OpenMaya.MPlugArray()
+    try:
+        node_fn.getConnections(m_plug_array)
+    except RuntimeError:
+        # nodes without connections fail the call
+        m_plug_array.clear()
+    return m_plug_array
 
 
 def get_plugs(o_node=None, source=True, ignore_nodes=(), ignore_attrs=(), attr_name=""):
@@ -1675,12 +2166,33 @@ def get_plugs(o_node=None, source=True, ignore_nodes=(), ignore_attrs=(), attr_n
     """
     if not isinstance(o_node, OpenMaya.MObject):
         o_node = get_m_obj(o_node)
-    node_fn = OpenMaya.MFnDependencyNode(o_node)
-    plug_names = ()
-    for i in range(node_fn.attributeCount()):
-        a_obj = node_fn.attribute(i)
-        m_plug = OpenMaya.MPlug(o_node, a_obj)
-        # m_plug_type_name = a_obj.apiTypeStr()
+    m_handle = OpenMaya.MObjectHandle(o_node)
+    cache_key = (m_handle.hashCode(), source, tuple(ignore_nodes), tuple(ignore_attrs), attr_name)
+    plug_names = get_cached_handle_value(__plugs_cache__, cache_key, m_handle)
+    if plug_names is not None:
+        return plug_names
+    ignore_fns = [_NODE_GET(ig, ig if isinstance(ig, int) else None) for ig in ignore_nodes]
+    ignore_fns = [fn for fn in ignore_fns if fn is not None]
+    plug_names = _get_plugs(o_node, source, ignore_fns, ignore_attrs, attr_name, [])
+    return cache_handle_value(__plugs_cache__, cache_key, m_handle, plug_names)
+
+
+def _get_plugs(o_node, source, ignore_fns, ignore_attrs, attr_name, visited):
+    """
+    get plugs, passes through the connected nodes of the ignored types.
+    :param o_node: <OpenMaya.MObject> object to find plugs from.
+    :param source: <bool> if true, get the source plug connections.
+    :param ignore_fns: <list> OpenMaya.MFn type ids of the nodes to pass through.
+    :param ignore_attrs: <tuple> ignores these attributes.
+    :param attr_name: <str> get connection from this attribute only.
+    :param visited: <list> the nodes already searched, so each node is only searched once.
+    :return: <tuple> plug names.
+    """
+    visited.append(o_node)
+    connected_plugs = get_connected_plugs(OpenMaya.MFnDependencyNode(o_node))
+    plug_names = []
+    for i in xrange(connected_plugs.length()):
+        m_plug = connected_plugs[i]
         m_plug_name = m_plug.name()
         if attr_name:
             if attr_name not in m_plug_name:
@@ -1693,20 +2205,18 @@ def get_plugs(o_node=None, source=True, ignore_nodes=(), ignore_attrs=(), attr_n
         plug_array_len = m_plug_array.length()
         for idx in range(plug_array_len):
             plug = m_plug_array[idx]
-            plug_name = plug.name()
             plug_node = plug.node()
-            if not ignore_nodes:
-                plug_names += plug_name,
-            elif ignore_nodes:
-                if [ig for ig in ignore_nodes if has_fn(plug_node, ig)]:
-                    plug_names += get_plugs(plug_name, source=source, ignore_nodes=ignore_nodes),
-                else:
-                    plug_names += plug_name,
-    return plug_names
+            if ignore_fns and any(plug_node.hasFn(fn) for fn in ignore_fns):
+                if not [v for v in visited if v == plug_node]:
+                    plug_names.append(_get_plugs(plug_node, source, ignore_fns, (), "", visited))
+            else:
+                plug_names.append(plug.name())
+    return tuple(plug_names)
 
 
 class Item(OpenMaya.MObject):
     NODE = None
+    ATTRIBUTES = None
 
     def __init__(self, *args):
         args = get_m_obj(*args),
@@ -1715,11 +2225,23 @@ class Item(OpenMaya.MObject):
 
     def update_node_variable(self):
         self.NODE = OpenMaya.MFnDependencyNode(self)
+        self.ATTRIBUTES = None
 
     @property
     def node(self):
         return self.NODE
 
+    @property
+    def attributes(self):
+        """
+        the attribute objects of this node, collected on first use.
+        :return: <tuple> array of attribute OpenMaya.MObject(s).
+        """
+        if self.ATTRIBUTES is None:
+            node_fn = self.node
+            self.ATTRIBUTES = tuple([node_fn.attribute(a_i) for a_i in xrange(node_fn.attributeCount())])
+        return self.ATTRIBUTES
+
     def name(self):
         return self.node.name()
 
@@ -1732,7 +2254,7 @@ class Item(OpenMaya.MObject):
         :param attribute_name: <str> the attribute string to compare and check.
         :return: <bool> True for yes. <bool> False for no.
         """
-        return filter(lambda x: attribute_name in x, self.get_plug_names(full_name=False))
+        return any(attribute_name in x for x in self.get_plug_names(full_name=False))
 
     def source_plugs(self):
         """
@@ -1754,22 +2276,21 @@ class Item(OpenMaya.MObject):
         count the number of available attributes for this node.
         :return: <int> attribute count.
         """
-        return self.node.attributeCount()
+        return len(self.attributes)
 
     def get_plugs(self, name=''):
         """
         return an array of available plug objects by this item.
         :return: <tuple> plug arrays.
         """
-        plugs = ()
-        for a_i in xrange(self.attr_count):
-            a_obj = self.node.attribute(a_i)
+        plugs = []
+        for a_obj in self.attributes:
             a_plug = OpenMaya.MPlug(self, a_obj)
             if name and name in a_plug.name():
-                plugs += a_plug,
+                plugs.append(a_plug)
             else:
-                plugs += a_plug,
-        return plugs
+                plugs.append(a_plug)
+        return tuple(plugs)
 
     def get_plug_obj(self, name=''):
         """
@@ -1784,14 +2305,13 @@ class Item(OpenMaya.MObject):
         return an array of available plug objects by this item.
         :return: <tuple> plug arrays.
         """
-        plugs = ()
-        for a_i in xrange(self.attr_count):
-            a_obj = self.node.attribute(a_i)
+        plugs = []
+        for a_obj in self.attributes:
             if full_name:
-                plugs += OpenMaya.MPlug(self, a_obj).name(),
+                plugs.append(OpenMaya.MPlug(self, a_obj).name())
             else:
-                plugs += OpenMaya.MPlug(self, a_obj).name().rpartition('.')[-1],
-        return plugs
+                plugs.append(OpenMaya.MPlug(self, a_obj).name().rpartition('.')[-1])
+        return tuple(plugs)
 
     @staticmethod
     def split_attr_names(array_items=()):
@@ -1807,7 +2327,7 @@ class Item(OpenMaya.MObject):
         :param search: <str> the string name to filter the array with.
         :return: <tuple> array of filtered items.
         """
-        return filter(lambda x: search in x, self.get_plug_names(full_name=False))
+        return tuple([x for x in self.get_plug_names(full_name=False) if search in x])
 
     def filter_plugs_by_regex(self, search="", ignore_case=False, dot_all=False, verbose=False):
         """
@@ -1830,7 +2350,7 @@ class Item(OpenMaya.MObject):
         filters the incoming plugs by name.
         :return: <tuple> array of filtered plug names.
         """
-        return filter(lambda x: search in x, self.source_plugs())
+        return tuple([x for x in self.source_plugs() if search in x])
 
     def filter_destination_plugs_by_regex(self, search="", ignore_case=False, dot_all=False, verbose=False):
         """
@@ -1840,15 +2360,16 @@ class Item(OpenMaya.MObject):
         return self.filter_array_by_regex(
             self.destination_plugs(), search=search, ignore_case=ignore_case, dot_all=dot_all, verbose=verbose)
 
-    def filter_source_plugs_by_name(self, search=""):
+    def filter_destination_plugs_by_name(self, search=""):
         """
         filters the outgoing plugs by name.
         :return: <tuple> array of filtered plug names.
         """
-        return filter(lambda x: search in x, self.destination_plugs())
+        return tuple([x for x in self.destination_plugs() if search in x])
 
     @staticmethod
-    def filter_array_by_regex(array_objects=(), search="", ignore_case=False, dot_all=False, verbose=False):
+    def filter_array_by_regex(array_objects=(), search="", ignore_case=False, dot_all=False, verbose=False,
+                              pattern=None):
         """
         filters the array of names by regex.
         :param array_objects: <tuple> array of objects to filter from.
@@ -1856,17 +2377,15 @@ class Item(OpenMaya.MObject):
         :param ignore_case: <bool> adds re.IGNORECASE flag to the re.compile
         :param dot_all: <bool> adds re.IGNORECASE flag to the re.compile
         :param verbose: <bool> adds re.VERBOSE flag to the re.compile
+        :param pattern: <re.RegexObject> if given, use this compiled pattern instead of compiling the search string.
         :return: <tuple> array of filtered items.
         """
-        if ignore_case:
-            re_search = re.compile(search, re.I)
-        elif dot_all:
-            re_search = re.compile(search, re.S)
-        elif verbose:
-            re_search = re.compile(search, re.X)
+        if pattern is not None:
+            re_search = pattern
         else:
-            re_search = re.compile(search)
-        return filter(lambda x: re_search.search(x), array_objects)
+            flags = (re.I if ignore_case else 0) | (re.S if dot_all else 0) | (re.X if verbose else 0)
+            re_search = compile_regex(search, flags)
+        return tuple([x for x in array_objects if re_search.search(x)])
 
     def compare(self, m_obj=None):
         """
@@ -1877,6 +2396,19 @@ class Item(OpenMaya.MObject):
         return compare_objects(self, m_obj, fn=True)
 
 
+def compile_regex(search="", flags=0):
+    """
+    compile the regex pattern, stores the pattern for the repeated searches.
+    :param search: <str> the regex string to compile.
+    :param flags: <int> re module flags.
+    :return: <re.RegexObject> compiled pattern.
+    """
+    cache_key = search, flags
+    if cache_key in __regex_cache__:
+        return __regex_cache__[cache_key]
+    return cache_value(__regex_cache__, cache_key, re.compile(search, flags))
+
+
 def attr_connect(attr_src, attr_trg):
     """
     connect the attributes from the source attribute to the target attribute.
@@ -1884,11 +2416,36 @@ def attr_connect(attr_src, attr_trg):
     :param attr_trg: <str> target attribute.
     :return: <bool> True for success. <bool> False for failure.
     """
-    if not cmds.isConnected(attr_src, attr_trg):
+    if not is_plug_connected(attr_src, attr_trg):
         cmds.connectAttr(attr_src, attr_trg)
     return True
 
 
+def is_plug_connected(attr_src, attr_trg):
+    """
+    check if the source attribute is connected to the target attribute through the plugs.
+    :param attr_src: <str> source attribute.
+    :param attr_trg: <str> target attribute.
+    :return: <bool> True for yes. <bool> False for no.
+    """
+    m_sel = OpenMaya.MSelectionList()
+    m_sel.add(attr_src)
+    m_sel.add(attr_trg)
+    src_plug = OpenMaya.MPlug()
+    trg_plug = OpenMaya.MPlug()
+    m_sel.getPlug(0, src_plug)
+    m_sel.getPlug(1, trg_plug)
+    m_plug_array = OpenMaya.MPlugArray()
+    trg_plug.connectedTo(m_plug_array, True, False)
+    if m_plug_array.length() and m_plug_array[0] == src_plug:
+        return True
+    # array and compound plugs can be connected through their elements, children or parents
+    for m_plug in (src_plug, trg_plug):
+        if m_plug.isArray() or m_plug.isElement() or m_plug.isCompound() or m_plug.isChild():
+            return cmds.isConnected(attr_src, attr_trg)
+    return False
+
+
 def attr_add_float(node_name, attribute_name, min_value=None, max_value=None):
     """
     add the new attribute to this node.
@@ -1898,14 +2455,17 @@ def attr_add_float(node_name, attribute_name, min_value=None, max_value=None):
     :param max_value: <float> if given, will edit the attribute's maximum value.
     :return: <str> new attribute name.
     """
-    if not cmds.objExists(attr_name(node_name, attribute_name)):
-        cmds.addAttr(node_name, at='float', ln=attribute_name)
-        cmds.setAttr(attr_name(node_name, attribute_name), k=1)
-    if not isinstance(min_value, type(None)):
-        cmds.addAttr(attr_name(node_name, attribute_name), edit=True, min=min_value)
-    if not isinstance(max_value, type(None)):
-        cmds.addAttr(attr_name(node_name, attribute_name), edit=True, max=max_value)
-    return attr_name(node_name, attribute_name)
+    full_name = attr_name(node_name, attribute_name)
+    limits = {}
+    if min_value is not None:
+        limits['min'] = min_value
+    if max_value is not None:
+        limits['max'] = max_value
+    if not cmds.objExists(full_name):
+        cmds.addAttr(node_name, at='float', ln=attribute_name, k=True, **limits)
+    elif limits:
+        cmds.addAttr(full_name, edit=True, **limits)
+    return full_name
 
 
 def attr_set_min_max(node_name, attribute_name, min=0.0, max=1.0):
@@ -1964,13 +2524,18 @@ def attr_split(a_name):
     return tuple(a_name.split('.'))
 
 
-def create_node(node_type, node_name=""):
+def create_node(node_type, node_name="", fast=False):
     """
     creates this node name.
     :param node_type: <str> create this type of node.
     :param node_name: <str> create a node with this name.
+    :param fast: <bool> the name is known to be unique, skip the exists check.
     :return: <str> node name.
     """
+    if fast:
+        if node_name:
+            return cmds.createNode(node_type, name=node_name)
+        return cmds.createNode(node_type)
     if not cmds.objExists(node_name):
         return cmds.createNode(node_type, name=node_name)
     return node_name
@@ -2096,7 +2661,7 @@ def do_set_attr(source_node_attr, value):
     if isinstance(value, (list, tuple)):
         cmds.setAttr(source_node_attr, value, type="double3")
         return True
-    if isinstance(value, (str, unicode)):
+    if isinstance(value, string_types):
         cmds.setAttr(source_node_attr, value, type="string")
         return True
     return False
@@ -761,7 +761,7 @@ def mirror_object(control_name="", mirror_obj_name="", invert_rotate=False, keep
     c_transform = Transform(control_name)
     w_matrix = c_transform.get_world_matrix()
     mir_matrix = c_transform.mirror_matrix(w_matrix)
-    rotation_values = cmds.xform(control_name, ro=1, q=1)
+    rotation_values = object_utils.get_rotation_list(control_name)
     if invert_rotate:
         # mirror rotate y
         rotation_values[1] *= -1
@@ -79,6 +79,7 @@ def get_available_modules():
     return [x for x in os.listdir(rig_modules_dir)
             if "template" not in x
             if "__init__" not in x
+            if "_deferred" not in x
             if ".pyc" not in x]
 
 
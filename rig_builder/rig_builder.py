@@ -25,6 +25,7 @@ from rig_utils import control_utils
 from maya_utils import ui_utils
 from maya_utils import file_utils
 from maya_utils import object_utils
+from rig_modules import _deferred
 
 # import qt modules
 from maya_utils.ui_utils import QtWidgets
@@ -738,8 +739,11 @@ class ModuleForm(QtWidgets.QFrame):
         builds all the items in the list.
         :return: <bool> True for success.
         """
-        for mod in MODULES_LIST:
-            mod.perform_module_finish_call()
+        # the module connections are made together once every module has finished,
+        # inside a single refresh suspension that the nested blocks share
+        with object_utils.suspend_refresh(evaluation=True), _deferred.deferred_finish():
+            for mod in MODULES_LIST:
+                mod.perform_module_finish_call()
         return True
 
     def create_all_call(self):
@@ -55,6 +55,9 @@ class PreBuild(template.TemplateModule):
         if self.finished:
             return False
 
+        # the post build script expects the module connections to be made already
+        template.finish_all()
+
         # open and execute the file to finish building the character
         imp.load_source("creature_file", self.post_build_file)
 
@@ -4,6 +4,7 @@ singleton method to creating a single joint in the scene.
 # import maya modules
 from maya import cmds
 from rig_modules import template
+from maya_utils import object_utils
 
 class_name = "PreBuild"
 
@@ -30,7 +31,9 @@ class PreBuild(template.TemplateModule):
         do nothing
         :return:
         """
-        cmds.file(new=True, f=1)
+        # the viewport would otherwise redraw while the old scene is torn down
+        with object_utils.suspend_refresh(undo_chunk=False):
+            cmds.file(new=True, f=1)
         # clears the script editor history
         # cmds.scriptEditorInfo(clearHistory=1)
         # set the boolean variable
@@ -46,7 +49,8 @@ class PreBuild(template.TemplateModule):
 
         # imports the geo file
         if 'geoFile' in self.information:
-            cmds.file(self.information['geoFile'], i=1, f=1)
+            with object_utils.suspend_refresh(undo_chunk=False):
+                cmds.file(self.information['geoFile'], i=1, f=1)
 
         print("[{}] :: finished.".format(class_name))
         self.finished = True
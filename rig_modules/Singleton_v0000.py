@@ -69,10 +69,9 @@ class Singleton(template.TemplateModule):
         :return: <bool> True for success.
         """
         self.name = name
-        for idx, guide_jnt in enumerate(self.guide_joints):
-            new_name = name_utils.get_guide_name("", name, self.suffix_name)
-            object_utils.rename_node(guide_jnt, new_name)
-            self.guide_joints[idx] = new_name
+        if self.guide_joints:
+            new_names = name_utils.get_guide_names("", name, self.suffix_name, length=len(self.guide_joints))
+            self.guide_joints = list(object_utils.rename_nodes(self.guide_joints, new_names))
 
         if self.built_groups:
             control_utils.rename_controls(self.built_groups[0], new_name=name)
@@ -143,11 +142,12 @@ class Singleton(template.TemplateModule):
         if self.created:
             return False
 
-        # create the guide joints, collect the self.guide_joints class array.
-        self.create_guides()
+        with object_utils.suspend_refresh():
+            # create the guide joints, collect the self.guide_joints class array.
+            self.create_guides()
 
-        # set the guide joint positions
-        self.set_guide_positions()
+            # set the guide joint positions
+            self.set_guide_positions()
 
         self.created = True
         return True
@@ -0,0 +1,115 @@
+"""
+Queues the connections made when the modules finish, so a full build performs them together.
+"""
+# import standard modules
+import contextlib
+
+# import custom modules
+from maya_utils import object_utils
+
+# define private variables
+__deferring__ = False
+
+
+class Registry(object):
+    """
+    the queued module connections, stored as parallel arrays with one entry per finished module.
+    """
+    controllers = []
+    parents = []
+    constrains = []
+
+    @classmethod
+    def add(cls, controller_data, parent_to="", constrain_to=""):
+        """
+        queue the connections of one module.
+        :param controller_data: <dict> the module controller data, with 'controller' and 'group_names'.
+        :param parent_to: <str> parent the top controller group to this object.
+        :param constrain_to: <str> parent constrain the controller to this object.
+        :return: <int> the number of queued modules.
+        """
+        cls.controllers.append(controller_data)
+        cls.parents.append(parent_to)
+        cls.constrains.append(constrain_to)
+        return len(cls.controllers)
+
+    @classmethod
+    def clear(cls):
+        """
+        empties the queue.
+        :return: <None>
+        """
+        del cls.controllers[:]
+        del cls.parents[:]
+        del cls.constrains[:]
+
+
+def is_deferring():
+    """
+    check if the module connections are being queued.
+    :return: <bool> True for yes, <bool> False for no.
+    """
+    return __deferring__
+
+
+def connect(controller_data, parent_to="", constrain_to=""):
+    """
+    perform the module connections, or queue them while deferring.
+    :param controller_data: <dict> the module controller data, with 'controller' and 'group_names'.
+    :param parent_to: <str> parent the top controller group to this object.
+    :param constrain_to: <str> parent constrain the controller to this object.
+    :return: <bool> True for connected. <bool> False when queued.
+    """
+    if __deferring__:
+        Registry.add(controller_data, parent_to=parent_to, constrain_to=constrain_to)
+        return False
+    if constrain_to:
+        object_utils.do_parent_constraint(constrain_to, controller_data['controller'])
+    if parent_to:
+        object_utils.do_parent(controller_data['group_names'][-1], parent_to)
+    return True
+
+
+def flush_finish():
+    """
+    performs all the queued constraints, then all the queued parenting, in one undo chunk.
+    :return: <bool> True for success. <bool> False for nothing queued.
+    """
+    if not Registry.controllers:
+        return False
+    # take the queue before running it, so a failed connection does not leave it to the next build
+    controllers = list(Registry.controllers)
+    parents = list(Registry.parents)
+    constrains = list(Registry.constrains)
+    Registry.clear()
+    with object_utils.suspend_refresh():
+        for controller_data, constrain_to in zip(controllers, constrains):
+            if constrain_to:
+                object_utils.do_parent_constraint(constrain_to, controller_data['controller'])
+        for controller_data, parent_to in zip(controllers, parents):
+            if parent_to:
+                object_utils.do_parent(controller_data['group_names'][-1], parent_to)
+    return True
+
+
+@contextlib.contextmanager
+def deferred_finish():
+    """
+    queues the module connections made inside, and performs them all on exit.
+    when the block raises, the queued connections are dropped instead.
+    :return: <None>
+    """
+    global __deferring__
+    if __deferring__:
+        # already queued by an outer block, which will flush
+        yield
+        return
+    __deferring__ = True
+    try:
+        yield
+    except:
+        Registry.clear()
+        raise
+    finally:
+        __deferring__ = False
+    flush_finish()
@@ -8,9 +8,19 @@ import gc
 from maya_utils import object_utils
 from rig_utils import joint_utils
 from rig_utils import control_utils
+from rig_modules import _deferred
 
 # define module variables
 class_name = "Template"
+Registry = _deferred.Registry
+
+
+def finish_all():
+    """
+    performs the queued connections of all the finished modules in one pass.
+    :return: <bool> True for success. <bool> False for nothing queued.
+    """
+    return _deferred.flush_finish()
 
 
 class TemplateModule(object):
@@ -91,7 +101,7 @@ class TemplateModule(object):
 
     def perform_connections(self):
         """
-        performs the connections between the modules
+        performs the connections between the modules, queued when the build defers them.
         :return: <bool> True for success. <bool> False for failure.
         """
         if not self.information:
@@ -104,27 +114,27 @@ class TemplateModule(object):
             control_data = self.controller_data
 
         # we want to deliberately raise an error when the object is not found
-        if "constrainTo" in self.information:
-            constrain_to = self.information['constrainTo']
-            if constrain_to:
-                if not object_utils.is_exists(constrain_to):
-                    ctrl_obj = control_utils.get_control_name(constrain_to)
-                    if object_utils.is_exists(ctrl_obj):
-                        object_utils.do_parent_constraint(ctrl_obj, control_data['controller'])
-                else:
-                    object_utils.do_parent_constraint(constrain_to, control_data['controller'])
-
-        if "parentTo" in self.information:
-            parent_to = self.information['parentTo']
-            if parent_to:
-                if not object_utils.is_exists(parent_to):
-                    ctrl_obj = control_utils.get_control_name(parent_to)
-                    if object_utils.is_exists(ctrl_obj):
-                        object_utils.do_parent(control_data['group_names'][-1], ctrl_obj)
-                else:
-                    object_utils.do_parent(control_data['group_names'][-1], parent_to)
+        constrain_target = self.get_connection_target(self.information.get('constrainTo', ""))
+        parent_target = self.get_connection_target(self.information.get('parentTo', ""))
+        _deferred.connect(control_data, parent_to=parent_target, constrain_to=constrain_target)
         return True
 
+    @staticmethod
+    def get_connection_target(target_name):
+        """
+        finds the scene object to connect to, either the object itself or the controller with that name.
+        :param target_name: <str> the object name from the module information.
+        :return: <str> the object name. <str> empty when nothing is found.
+        """
+        if not target_name:
+            return ""
+        if object_utils.is_exists(target_name):
+            return target_name
+        ctrl_obj = control_utils.get_control_name(target_name)
+        if object_utils.is_exists(ctrl_obj):
+            return ctrl_obj
+        return ""
+
     def update_information(self, dictionary):
         """
         updates the publush attributes dictionary
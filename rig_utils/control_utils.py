@@ -10,17 +10,28 @@ import constraint_utils
 import name_utils
 
 # import custom modules
-from maya_utils import file_utils
 from maya_utils import object_utils
 from maya_utils import attribute_utils
-from maya_utils import transform_utils
-from maya_utils import curve_utils
+from maya_utils import array_utils
 
 # import maya modules
 from maya import cmds
+from maya import mel
+from maya import OpenMaya
+from maya.api import OpenMaya as OpenMaya2
 
 # define private variables
-__control_folder_dir__ = file_utils.controller_data_dir()
+__control_folder_dir__ = None
+__controllers_cache__ = {}
+__shape_index__ = {}
+
+# remove the callbacks from the previously loaded module
+try:
+    for __callback_id__ in __callbacks__:
+        OpenMaya.MMessage.removeCallback(__callback_id__)
+except NameError:
+    pass
+__callbacks__ = []
 
 # define local variables
 CTRL_SUFFIX = name_utils.CTRL_SUFFIX
@@ -30,15 +41,50 @@ GROUP_NAME = name_utils.GROUP_NAME
 re_brackets = re.compile(r'\[|]')
 re_numbers = re.compile('_\d+')
 transform_attrs = attribute_utils.Attributes.DEFAULT_ATTR_VALUES
+_TFM_PAIRS = tuple(transform_attrs.items())
 side_cls = read_sides.Sides()
+side_colors = {'Center': 'yellow', 'Left': 'blue', 'Right': 'red'}
+_CTRL_SFX = '_' + CTRL_SUFFIX
+_LOC_SFX = '_' + LOCATOR_SUFFIX
 
 
-def get_controllers():
+def clear_controllers_cache(*args):
     """
-    get all controllers in scene.
+    flushes the stored scene controllers. Called by the scene callbacks.
+    :param args: callback arguments, not used.
+    :return: <None>
+    """
+    __controllers_cache__.clear()
+
+
+def add_cache_callbacks():
+    """
+    clears the stored scene controllers when nodes are created, deleted or renamed, or the scene changes.
+    :return: <None>
+    """
+    __callbacks__.append(
+        OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeNew, clear_controllers_cache))
+    __callbacks__.append(
+        OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterOpen, clear_controllers_cache))
+    __callbacks__.append(OpenMaya.MDGMessage.addNodeAddedCallback(clear_controllers_cache))
+    __callbacks__.append(OpenMaya.MDGMessage.addNodeRemovedCallback(clear_controllers_cache))
+    __callbacks__.append(
+        OpenMaya.MNodeMessage.addNameChangedCallback(OpenMaya.MObject.kNullObj, clear_controllers_cache))
+
+
+# register the cache callbacks
+add_cache_callbacks()
+
+
+def get_controllers(refresh=False):
+    """
+    get all controllers in scene, the result is stored until the scene nodes change.
+    :param refresh: <bool> list the controllers again instead of using the stored result.
     :return: <tuple> controller objects.
     """
-    return tuple(cmds.ls('*_{}'.format(CTRL_SUFFIX)) + cmds.ls('*:*_{}'.format(CTRL_SUFFIX)))
+    if refresh or 'controllers' not in __controllers_cache__:
+        __controllers_cache__['controllers'] = tuple(cmds.ls('*' + _CTRL_SFX) + cmds.ls('*:*' + _CTRL_SFX))
+    return __controllers_cache__['controllers']
 
 
 def get_selected_ctrl():
@@ -59,20 +105,21 @@ def mirror_transforms(object_name=""):
     """
     if not object_name:
         object_name = object_utils.get_selected_node(single=True)
-    mirror_obj_name = ''
-    if '_l_' in object_name:
+    is_left = '_l_' in object_name
+    is_right = '_r_' in object_name
+    # the side has to be one or the other to find the mirror object
+    if is_left == is_right:
+        return False
+    if is_left:
         mirror_obj_name = object_name.replace('_l_', '_r_')
-    if '_r_' in object_name:
+    else:
         mirror_obj_name = object_name.replace('_r_', '_l_')
-    if mirror_obj_name == mirror_obj_name:
-        return False
     p_object = object_utils.get_transform_relatives(
         object_name, find_parent=True, as_strings=True)[0]
     p_mirror_object = object_utils.get_transform_relatives(
         mirror_obj_name, find_parent=True, as_strings=True)[0]
-    p_trm = transform_utils.Transform(p_object)
-    matrix = p_trm.world_matrix()
-    mirror_matrix = p_trm.mirror_matrix(matrix)
+    matrix = object_utils.get_world_matrix_list(p_object)
+    mirror_matrix = array_utils.mirror_matrices(matrix)[0]
     cmds.xform(p_mirror_object, m=mirror_matrix, ws=1)
     return True
 
@@ -81,7 +128,10 @@ def create_locators():
     """
     create locators on position
     """
-    for sl in cmds.ls(sl=1):
+    selection = cmds.ls(sl=1)
+    if not selection:
+        return True
+    for sl in selection:
         if '.' in sl:
             name, dot, num = sl.partition('.')
             matrix = False
@@ -91,7 +141,7 @@ def create_locators():
             matrix = True
             translate = False
             name = sl
-        locator_name = name + '_{}'.format(LOCATOR_SUFFIX)
+        locator_name = name + _LOC_SFX
         cmds.createNode('locator', name=locator_name + 'Shape')
         object_utils.snap_to_transform(locator_name, sl, matrix=matrix, translate=translate)
     return True
@@ -104,7 +154,7 @@ def copy_xform(object_1, object_2):
     :param object_2: <str> the second object.
     :return: <bool> True for success.
     """
-    x_mat = cmds.xform(object_1, m=1, q=1, ws=1)
+    x_mat = object_utils.get_world_matrix_list(object_1)
     cmds.xform(object_2, m=x_mat, ws=1)
     return True
 
@@ -115,10 +165,7 @@ def check_locator_suffix_name(object_name):
     :param object_name:
     :return:
     """
-    suffix_name = '_{}'.format(LOCATOR_SUFFIX)
-    if suffix_name in object_name:
-        return True
-    return False
+    return _LOC_SFX in object_name
 
 
 def remove_locator_suffix_name(object_name):
@@ -127,8 +174,7 @@ def remove_locator_suffix_name(object_name):
     :param object_name:
     :return:
     """
-    suffix_name = '_{}'.format(LOCATOR_SUFFIX)
-    return object_name.rpartition(suffix_name)[0]
+    return object_name.rpartition(_LOC_SFX)[0]
 
 
 def check_control_suffix_name(object_name):
@@ -137,10 +183,7 @@ def check_control_suffix_name(object_name):
     :param object_name: <str> the object name to split.
     :return: <str> formatted name.
     """
-    suffix_name = '_{}'.format(CTRL_SUFFIX)
-    if suffix_name in object_name:
-        return True
-    return False
+    return _CTRL_SFX in object_name
 
 
 def remove_control_suffix_name(object_name):
@@ -149,7 +192,7 @@ def remove_control_suffix_name(object_name):
     :param object_name: <str> the object name to split.
     :return: <str> formatted name.
     """
-    return object_name.rpartition('_{}'.format(CTRL_SUFFIX))[0]
+    return object_name.rpartition(_CTRL_SFX)[0]
 
 
 def snap_control_to_selected_locator():
@@ -171,76 +214,115 @@ def get_shape_names(transforms_array=()):
     :param transforms_array: <tuple> array of transform objects
     :return: <tuple> shape names.
     """
-    shapes_array = ()
+    shapes_array = []
     for transform_name in transforms_array:
-        shapes_array += object_utils.get_shape_name(transform_name, "nurbsCurve")
-    return shapes_array
+        shapes_array.extend(object_utils.get_shape_name(transform_name, "nurbsCurve"))
+    return tuple(shapes_array)
 
 
-def color_code_controllers():
+def color_code_controllers(controllers=()):
     """
     color code all controller shape names.
+    :param controllers: <tuple> (optional) the controllers to color, if not given, all the scene controllers.
     :return: <bool> True for success.
     """
-    ctrl_curves = get_controllers()
+    ctrl_curves = controllers or get_controllers()
     shape_names_array = get_shape_names(ctrl_curves)
+    color_shapes = {}
     for shape_name in shape_names_array:
         # get a uniform side name
         side_name = side_cls.side_name_from_string(shape_name)
-        if side_name == 'Center':
-            curve_utils.set_nurb_shape_color(shape_name, color='yellow')
-        if side_name == 'Left':
-            curve_utils.set_nurb_shape_color(shape_name, color='blue')
-        if side_name == 'Right':
-            curve_utils.set_nurb_shape_color(shape_name, color='red')
-    return True
-
+        if side_name in side_colors:
+            color_shapes.setdefault(side_colors[side_name], []).append(shape_name)
+    from maya_utils import curve_utils
 
-def attr_str(ctrl_name, attr_name):
-    """
-    join the two strings together to form the attribute name.
-    :param ctrl_name:
-    :param attr_name:
-    :return:
-    """
-    return '{}.{}'.format(ctrl_name, attr_name)
+    # color each side in one call
+    for color, shape_names in color_shapes.items():
+        curve_utils.set_nurb_shapes_color(shape_names, color=color)
+    return True
 
 
-def zero_controllers():
+def zero_controllers(controllers=()):
     """
     assuming controllers are all named with a suffix _ctrl
+    :param controllers: <tuple> (optional) the controllers to zero, if not given, all the scene controllers.
     :return: <bool> True for success.
     """
-    for ctrl_name in get_controllers():
-        for attr_name, attr_val in transform_attrs.items():
-            ctrl_attribute = attr_str(ctrl_name, attr_name)
+    set_commands = []
+    for ctrl_name in controllers or get_controllers():
+        for attr_name, attr_val in _TFM_PAIRS:
             if not object_utils.is_attr_keyable(ctrl_name, attr_name):
                 continue
             if object_utils.is_attr_connected(ctrl_name, attr_name):
                 continue
-            cmds.setAttr(ctrl_attribute, attr_val)
+            set_commands.append('setAttr "%s.%s" %s' % (ctrl_name, attr_name, attr_val))
+    _eval_set_commands(set_commands)
     return True
 
 
-def zero_all_controllers():
+def zero_all_controllers(controllers=()):
     """
     zeroes out all the scene controllers.
+    :param controllers: <tuple> (optional) the controllers to zero, if not given, all the scene controllers.
     :return: <bool> True for success.
     """
-    for ctrl_name in get_controllers():
-        c_attr = attribute_utils.Attributes(ctrl_name, keyable=True)
-        if c_attr.non_zero_attributes():
-            c_attr.zero_attributes()
+    controllers = controllers or get_controllers()
+    if not controllers:
+        return True
+    m_sel = OpenMaya2.MSelectionList()
+    for ctrl_name in controllers:
+        m_sel.add(ctrl_name)
+
+    # read the plugs through the api, the values are still set through mel so the change can be undone
+    set_commands = []
+    for idx in range(m_sel.length()):
+        ctrl_name = m_sel.getSelectionStrings(idx)[0]
+        node_fn = OpenMaya2.MFnDependencyNode(m_sel.getDependNode(idx))
+        for attr_name, attr_val in _TFM_PAIRS:
+            if not node_fn.hasAttribute(attr_name):
+                continue
+            m_plug = node_fn.findPlug(attr_name, False)
+            if not m_plug.isKeyable or m_plug.isLocked or m_plug.isDestination:
+                continue
+            if m_plug.asDouble() == attr_val:
+                continue
+            set_commands.append('setAttr "%s.%s" %s' % (ctrl_name, attr_name, attr_val))
+    _eval_set_commands(set_commands)
+    return True
+
+
+def _eval_set_commands(set_commands):
+    """
+    runs the setAttr statements in one mel call.
+    :param set_commands: <list> array of mel setAttr statements.
+    :return: <bool> True for success. <bool> False for nothing to set.
+    """
+    if not set_commands:
+        return False
+    mel.eval(';'.join(set_commands) + ';')
     return True
 
 
+def get_control_folder_dir():
+    """
+    the controller data directory, found on first use instead of at import.
+    :return: <str> directory path name.
+    """
+    global __control_folder_dir__
+    if __control_folder_dir__ is None:
+        from maya_utils import file_utils
+        __control_folder_dir__ = file_utils.controller_data_dir()
+    return __control_folder_dir__
+
+
 def get_controller_path(shape_name):
     """
     returns the shape name path.
     :param shape_name:
     :return:
     """
-    return file_utils.concatenate_path(__control_folder_dir__, shape_name)
+    from maya_utils import file_utils
+    return file_utils.concatenate_path(get_control_folder_dir(), shape_name)
 
 
 def save_controller_shape(controller_name):
@@ -248,21 +330,44 @@ def save_controller_shape(controller_name):
     saves the controller shape data to file.
     :return: <str> controller file path name.
     """
+    from maya_utils import file_utils
+    from maya_utils import curve_utils
+
     curve_data = curve_utils.get_nurb_data(controller_name)
     controller_data_file_name = get_controller_path(controller_name)
     json_cls = file_utils.JSONSerializer(file_name=controller_data_file_name)
     json_cls.write(data=curve_data)
     # print("[ControllerShapeFile] :: {}".format(json_cls.file_name))
+    __shape_index__.clear()
     return controller_data_file_name
 
 
+def get_shape_index(refresh=False):
+    """
+    the controller shape files in the directory, keyed by the name without the extension.
+    the directory is listed once, and again after a shape is saved.
+    :param refresh: <bool> list the directory again.
+    :return: <dict> shape file names.
+    """
+    from maya_utils import file_utils
+
+    if refresh or not __shape_index__:
+        __shape_index__.clear()
+        for file_name in find_controller_shapes():
+            __shape_index__[file_utils.split_file_name(file_name)] = file_name
+    return __shape_index__
+
+
 def find_shape_in_dir(shape_name):
     """
     returns the shape name from the directory.
     :param shape_name:
-    :return:
+    :return: <list> the matching shape files, the exact name match when there is one.
     """
-    return filter(lambda x: shape_name in file_utils.split_file_name(x), find_controller_shapes())
+    shape_index = get_shape_index()
+    if shape_name in shape_index:
+        return [shape_index[shape_name]]
+    return [file_name for name, file_name in shape_index.items() if shape_name in name]
 
 
 def is_shape_in_dir(shape_name):
@@ -280,9 +385,12 @@ def get_controller_data_file(shape_name):
     :param shape_name:
     :return:
     """
-    if not is_shape_in_dir(shape_name):
+    from maya_utils import file_utils
+
+    shape_files = find_shape_in_dir(shape_name)
+    if not shape_files:
         raise IOError("[NoControllerShapesFoundInDir] :: {}".format(shape_name))
-    shape_file = find_shape_in_dir(shape_name)[0]
+    shape_file = shape_files[0]
     controller_data_file_name = get_controller_path(shape_file)
     json_cls = file_utils.JSONSerializer(file_name=controller_data_file_name)
     return json_cls.read()
@@ -293,6 +401,7 @@ def find_controller_shapes():
     finds all the saves controller shapes.
     :return: <tuple> array of files.
     """
+    from maya_utils import file_utils
     return file_utils.list_controller_files()
 
 
@@ -303,10 +412,10 @@ def insert_groups(object_name="", names=()):
     :param names: <tuple> array of names to use to create the groups with.
     :return:
     """
-    grps = ()
+    grps = []
     for name in names:
-        grps += object_utils.insert_transform(object_name, name),
-    return grps
+        grps.append(object_utils.insert_transform(object_name, name))
+    return tuple(grps)
 
 
 def create_controller_shape(shape_name):
@@ -316,7 +425,7 @@ def create_controller_shape(shape_name):
     :return: <tuple> array of created curves.
     """
     curve_data = get_controller_data_file(shape_name)
-    curves = ()
+    curves = []
     for c_name, c_data in curve_data.items():
         form = c_data['form']
         knots = c_data['knots']
@@ -324,15 +433,13 @@ def create_controller_shape(shape_name):
         degree = c_data['degree']
         order = c_data['order']
         cv_length = len(cvs)
-        cv_points = ()
         # knot = cv_length + degree - 1
-        for cv_point in cvs:
-            cv_points += cv_point[1:],
+        cv_points = [tuple(cv_point[1:]) for cv_point in cvs]
         try:
-            curves += cmds.curve(p=cv_points, k=knots[:-2], degree=degree),
+            curves.append(cmds.curve(p=cv_points, k=knots[:-2], degree=degree))
         except RuntimeError:
-            curves += cmds.curve(p=cv_points, k=knots, degree=degree),
-    return curves
+            curves.append(cmds.curve(p=cv_points, k=knots, degree=degree))
+    return tuple(curves)
 
 
 def get_curve_shape_name(name=""):
@@ -350,10 +457,10 @@ def get_curve_shapes_in_array(curve_names):
     :param curve_names:
     :return:
     """
-    c_shapes = ()
+    c_shapes = []
     for c_name in curve_names:
-        c_shapes += object_utils.get_shape_name(c_name)[0],
-    return c_shapes
+        c_shapes.append(object_utils.get_shape_name(c_name)[0])
+    return tuple(c_shapes)
 
 
 def parent_curve_shapes(curve_names):
@@ -388,7 +495,8 @@ def create_control(shape_name='cube', name='', groups=('grp', CONSTRAINT_GRP)):
     else:
         curve_name = cmds.rename(curve_name, shape_name)
     return_data['controller'] = curve_name
-    group_names = map(lambda x: '{}_{}'.format(curve_name, x), groups)
+    group_prefix = curve_name + '_'
+    group_names = [group_prefix + x for x in groups]
     grps = insert_groups(curve_name, names=group_names)
     return_data['group_names'] = grps
     return return_data
@@ -403,13 +511,23 @@ def create_control_at_transform(object_name, name='', shape_name="cube", auto_nu
     :param auto_num: <int> generate a number associated with the name.
     :return: <str> control grp.
     """
-    tfm = transform_utils.Transform(object_name)
+    matrix = object_utils.get_world_matrix_list(object_name)
+    ctrl_data = _create_control_no_xform(name, shape_name=shape_name, auto_num=auto_num)
+    cmds.xform(ctrl_data['group_names'][-1], m=matrix, ws=1)
+    return ctrl_data
+
+
+def _create_control_no_xform(name='', shape_name="cube", auto_num=True):
+    """
+    creates a controller object at the origin, the caller places the top group.
+    :param name: <str> the name for the new controller object.
+    :param shape_name: <str> build this shape.
+    :param auto_num: <int> generate a number associated with the name.
+    :return: <dict> controller data.
+    """
     if auto_num:
         name = name_utils.get_start_name_with_num(name)
-    ctrl_data = create_control(shape_name, name=name)
-    grps = ctrl_data['group_names']
-    cmds.xform(grps[-1], m=tfm.world_matrix(), ws=1)
-    return ctrl_data
+    return create_control(shape_name, name=name)
 
 
 def get_control_name(name, idx=0):
@@ -430,12 +548,12 @@ def rename_controls(ctrl_grp, new_name=""):
     :return: <tuple> the names of the children created.
     """
     children = object_utils.get_transform_relatives(ctrl_grp, find_child=True, as_strings=True)
-    new_children = ()
+    new_children = []
     for ch in children:
         part_name = ch.partition('_')
         cmds.rename(ch, ''.join((new_name, part_name[1], part_name[2])))
-        new_children += ch,
-    return new_children
+        new_children.append(ch)
+    return tuple(new_children)
 
 
 def create_controls(objects_array, name='', shape_name="cube", apply_constraints=None, maintain_offset=False):
@@ -451,20 +569,27 @@ def create_controls(objects_array, name='', shape_name="cube", apply_constraints
     if isinstance(objects_array, str):
         objects_array = objects_array,
 
-    names = ()
+    names = [None] * len(objects_array)
     for idx in range(len(objects_array)):
         if not name:
             name = objects_array[idx]
-        names += name_utils.get_control_name(name, idx),
+        names[idx] = name_utils.get_control_name(name, idx)
 
     # if a string was given to the apply_constraints parameter, convert it to an array
     apply_constraints = object_utils.convert_str_to_list(apply_constraints)
 
-    groups = ()
-    # create controllers at the transform provided
-    for trfm_name, obj_name in zip(objects_array, names):
-        data = create_control_at_transform(trfm_name, obj_name, shape_name, auto_num=False)
+    # read all the transform matrices before creating anything
+    matrices = [object_utils.get_world_matrix_list(trfm_name) for trfm_name in objects_array]
+
+    # the viewport and the evaluation manager would otherwise update after every curve
+    with object_utils.suspend_refresh():
+        controls = [_create_control_no_xform(obj_name, shape_name, auto_num=False) for obj_name in names]
+        # place the controllers at the transform provided
+        for data, matrix in zip(controls, matrices):
+            cmds.xform(data['group_names'][-1], m=matrix, ws=1)
 
+    groups = []
+    for trfm_name, data in zip(objects_array, controls):
         if apply_constraints:
             if 'parent' in apply_constraints:
                 constraint_utils.parent_constraint(data['controller'], trfm_name, maintain_offset)
@@ -474,8 +599,8 @@ def create_controls(objects_array, name='', shape_name="cube", apply_constraints
                 constraint_utils.point_constraint(data['controller'], trfm_name, maintain_offset)
             if 'orient' in apply_constraints:
                 constraint_utils.orient_constraint(data['controller'], trfm_name, maintain_offset)
-        groups += data,
-    return groups
+        groups.append(data)
+    return tuple(groups)
 
 
 def create_controllers_with_standard_constraints(name, objects_array=(), shape_name="cube", maintain_offset=False):
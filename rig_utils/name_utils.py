@@ -162,6 +162,26 @@ def get_guide_name(prefix_name="", name="", suffix_name=""):
         return '{start_name}__{suffix}'.format(start_name=start_name, suffix=suffix_name)
 
 
+def get_guide_names(prefix_name="", name="", suffix_name="", length=1):
+    """
+    get the guide joint names for several joints at once, numbered on from the names already in the scene.
+    :param prefix_name: <str> prefix name.
+    :param name: <str> actual name.
+    :param suffix_name: <str> name after the name.
+    :param length: <int> the number of names to get.
+    :return: <tuple> guide joint names.
+    """
+    start_name = get_start_name(name, prefix_name=prefix_name)
+    if not re_numbers.findall(start_name):
+        start_idx = get_name_count(start_name, suffix_name=suffix_name)
+        return tuple(['{start_name}_{idx}__{suffix}'.format(start_name=start_name, idx=start_idx + i, suffix=suffix_name)
+                      for i in xrange(length)])
+    if length == 1:
+        return '{start_name}__{suffix}'.format(start_name=start_name, suffix=suffix_name),
+    return tuple(['{start_name}_{idx}__{suffix}'.format(start_name=start_name, idx=i, suffix=suffix_name)
+                  for i in xrange(length)])
+
+
 def get_bound_name_array(prefix_name="", name="", length=1):
     """
     return an array of bound joint names.